@@ -0,0 +1,22 @@
+# utils/document_ids.py
+"""
+Identifiant de document dérivé du nom de fichier
+
+Partagé par document_parser, event_parser et microaction_parser :
+les trois doivent produire le même doc_id pour un même fichier.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=8192)
+def _name_digest(file_name: str) -> str:
+    return hashlib.blake2b(os.fsencode(file_name), digest_size=16).hexdigest()
+
+
+def document_base_id(file_path: Path) -> str:
+    """/id/document/{blake2b-128 du nom de fichier} (identifiant opaque, non cryptographique)"""
+    return f"/id/document/{_name_digest(file_path.name)}"
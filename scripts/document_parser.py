@@ -4,61 +4,142 @@ Parser pour documents d'archives
 """
 
 import yaml
-import hashlib
 import re
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from .wikilink_extractor import WikilinkExtractor, WikilinkWarnings
 from .edtf_parser import EDTFParser
+from .parse_cache import ParseCache
+from .document_ids import document_base_id
+from .vault_scan import VaultIndex, markdown_files, folder_prefixes
+from .parallel import map_jobs
+
+# LibYAML (C) si disponible, sinon fallback pur Python
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    print("⚠️  LibYAML indisponible : parsing frontmatter en pur Python (installer libyaml)")
 
 
 class DocumentParser:
     """Parse les documents d'archives depuis Obsidian"""
 
-    ARCHIVE_KEYS = {"archive_ref", "cote", "fonds", "reference", "versement", "shelfmark"}
+    # Version des payloads du cache de parsing (content normalisé, verdict archive...) :
+    # à incrémenter dès que _parse_document_worker change ce qu'il produit
+    PARSE_CACHE_VERSION = 1
 
-    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None):
+    ARCHIVE_KEYS = {"archive_ref", "cote", "fonds", "reference", "versement", "shelfmark"}
+    ARCHIVE_KEYS_BYTES = tuple(k.encode('utf-8') for k in ARCHIVE_KEYS)
+
+    WIKILINK_LABELED_RE = re.compile(r'\[\[/?(id/(?:person|org|gpe|place)/[0-9a-fA-F-]{36})\|([^\]]+)\]\]')
+    WIKILINK_PLAIN_RE = re.compile(r'\[\[/?(id/(?:person|org|gpe|place)/[0-9a-fA-F-]{36})\]\]')
+    # Appliqués au texte entier : [^...\n] garde la sémantique ligne à ligne
+    OBS_COMMENT_RE = re.compile(r'%%[^%\n]*%%')
+    HIGHLIGHT_RE = re.compile(r'==([^=\n]+)==')
+    # En-tête : lignes vides ou Sender:/Recipient:/Place:/Date:/Concerns:
+    METADATA_HEADER_RE = re.compile(
+        r'(?:[^\S\n]*(?:(?:Sender|Recipient|Place|Date|Concerns):[^\n]*)?(?:\n|\Z))*'
+    )
+
+    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None,
+                 cache_path: Optional[Path] = None, workers: Optional[int] = None,
+                 vault_index: Optional[VaultIndex] = None):
         self.vault_path = vault_path
         self.config = config
         self.folders = folders
+        self._folder_prefixes = folder_prefixes(folders)
+        self.workers = workers
+        self.vault_index = vault_index
         self._doc_id_index = {}
+        self._cache = ParseCache(cache_path, vault_path, self.PARSE_CACHE_VERSION)
 
     def _should_process_file(self, file_path: Path) -> bool:
         """Vérifie si le fichier doit être parsé selon les dossiers sélectionnés"""
-        if not self.folders:
-            return True
-
-        return any(file_path.is_relative_to(folder) for folder in self.folders)
+        return not self._folder_prefixes or str(file_path).startswith(self._folder_prefixes)
 
     def parse_all(self) -> Tuple[List[Dict[str, Any]], WikilinkWarnings]:
         """Parse tous les documents d'archives"""
         documents = []
         warnings = WikilinkWarnings()
 
-        for file_path in self.vault_path.rglob("*.md"):
+        jobs = []
+        stats = []
+        for file_path in markdown_files(self.vault_path, self.vault_index):
             if not self._should_process_file(file_path):
                 continue
 
             try:
-                doc = self._parse_document_file(file_path, warnings)
-                if doc:
-                    documents.append(doc)
+                stat = file_path.stat()
             except Exception as e:
                 warnings.log_parse_error(str(file_path), f"{type(e).__name__}: {str(e)}")
+                continue
+
+            cached = self._cache.get(file_path, stat)
+            if cached is not None and not cached['archive']:
+                continue
+
+            jobs.append((self.vault_path, file_path, cached))
+            stats.append(stat)
+
+        results = map_jobs(_parse_document_worker, jobs, self.workers)
+
+        # Assemblage séquentiel, dans l'ordre du vault (numérotation des collisions d'ID)
+        for (_, file_path, cached), stat, (payload, doc, file_warnings, error) in zip(jobs, stats, results):
+            warnings.merge(file_warnings)
+
+            if cached is None and payload is not None:
+                self._cache.put(file_path, stat, payload)
+
+            if payload is not None and payload['archive']:
+                doc_id = self._build_document_id(file_path, warnings)
+                if doc:
+                    doc['id'] = doc_id
+                    doc['references'].discard(doc_id)
+                    documents.append(doc)
+
+            if error:
+                warnings.log_parse_error(str(file_path), error)
+
+        self._cache.save()
 
         return documents, warnings
 
-    def _parse_document_file(self, file_path: Path, warnings: WikilinkWarnings) -> Optional[Dict[str, Any]]:
-        """Parse un fichier document"""
-        text = file_path.read_text(encoding='utf-8')
+    def _load_document(self, file_path: Path, cached: Optional[Dict]) -> Tuple[Dict, Optional[str]]:
+        """
+        Lit un fichier et détermine s'il s'agit d'un document d'archive.
+        Retourne (payload de cache, texte) ; texte None si pas un document d'archive.
+        """
+        if cached is not None and not cached['archive']:
+            return cached, None
+
+        raw = file_path.read_bytes()
+
+        # Pré-filtre : aucune clé d'archive dans le frontmatter brut → pas de parsing YAML
+        if cached is None and not self._may_be_archive_doc(raw):
+            return {'archive': False}, None
+
+        text = raw.decode('utf-8')
+        if '\r' in text:
+            # Mêmes fins de ligne que read_text() (newlines universels)
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        if cached is not None:
+            return cached, text
 
         frontmatter, body = self._split_frontmatter(text)
 
         if not self._is_archive_doc(frontmatter):
-            return None
+            return {'archive': False}, None
 
+        content = self._extract_narrative_text(self._clean_markdown(body))
+        return {'archive': True, 'frontmatter': frontmatter, 'content': content}, text
+
+    def _build_document(self, file_path: Path, text: str, payload: Dict,
+                        warnings: WikilinkWarnings) -> Dict[str, Any]:
+        """Construit le document (sans id : attribué à l'assemblage, cf. _build_document_id)"""
+        frontmatter = payload['frontmatter']
         rel_path = str(file_path.relative_to(self.vault_path))
-        doc_id = self._build_document_id(file_path, warnings)
 
         # Extraire wikilinks
         all_links = WikilinkExtractor.extract_all_wikilinks(text, warnings, str(file_path))
@@ -81,7 +162,7 @@ class DocumentParser:
             'title': file_path.stem,
             'file_path': rel_path,
             'source_path': rel_path,
-            'content': self._extract_narrative_text(self._clean_markdown(body)),
+            'content': payload['content'],
             'date_norm': date_norm,
             'date_start': date_start,
             'date_end': date_end,
@@ -93,15 +174,15 @@ class DocumentParser:
         }
 
         return {
-            'id': doc_id,
+            'id': None,
             'properties': properties,
-            'references': all_links - {doc_id}
+            'references': all_links
         }
 
     def _build_document_id(self, file_path: Path, warnings: WikilinkWarnings) -> str:
         """Génère ID document depuis nom fichier uniquement"""
         file_name = file_path.name
-        base_id = f"/id/document/{hashlib.sha1(file_name.encode('utf-8')).hexdigest()}"
+        base_id = document_base_id(file_path)
 
         if base_id in self._doc_id_index:
             self._doc_id_index[base_id]["count"] += 1
@@ -121,19 +202,35 @@ class DocumentParser:
         if not text.startswith('---'):
             return {}, text
 
-        parts = text.split('---', 2)
-        if len(parts) < 3:
+        # Mêmes bornes que text.split('---', 2), sans découper tout le texte
+        end = text.find('---', 3)
+        if end == -1:
             return {}, text
 
         try:
-            fm = yaml.safe_load(parts[1]) or {}
-            body = parts[2].lstrip('\n')
+            fm = yaml.load(text[3:end], Loader=_SafeLoader) or {}
+            body = text[end + 3:].lstrip('\n')
             return fm, body
         except yaml.YAMLError:
             return {}, text
 
+    def _may_be_archive_doc(self, raw: bytes) -> bool:
+        """Test rapide sur octets : une clé d'archive apparaît-elle dans le frontmatter ?"""
+        if not raw.startswith(b'---'):
+            return False
+
+        end = raw.find(b'---', 3)
+        if end == -1:
+            return False
+
+        fm_bytes = raw[3:end]
+        return any(key in fm_bytes for key in self.ARCHIVE_KEYS_BYTES)
+
     def _is_archive_doc(self, frontmatter: Dict) -> bool:
         """Vérifie si c'est un document d'archive"""
+        if isinstance(frontmatter, dict):
+            # Intersection d'ensembles en C, sans générateur Python
+            return not self.ARCHIVE_KEYS.isdisjoint(frontmatter)
         return any(key in frontmatter for key in self.ARCHIVE_KEYS)
 
     def _extract_narrative_text(self, body: str) -> str:
@@ -158,34 +255,13 @@ class DocumentParser:
             narrative_part = body
 
         # Enlever les métadonnées structurées du début
-        lines = narrative_part.split('\n')
-        cleaned_lines = []
-        skip_metadata = True
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Skip métadonnées structurées
-            if skip_metadata:
-                if stripped.startswith(('Sender:', 'Recipient:', 'Place:', 'Date:', 'Concerns:')):
-                    continue
-                elif stripped == '':
-                    continue
-                else:
-                    # Début du texte narratif
-                    skip_metadata = False
-
-            # Garder le texte narratif
-            if not skip_metadata:
-                # Enlever commentaires Obsidian
-                line = re.sub(r'%%[^%]*%%', '', line)
-
-                # Enlever highlights (garder le contenu)
-                line = re.sub(r'==([^=]+)==', r'\1', line)
-
-                if line.strip():
-                    cleaned_lines.append(line)
+        narrative_part = narrative_part[self.METADATA_HEADER_RE.match(narrative_part).end():]
+
+        # Enlever commentaires Obsidian, puis highlights (garder le contenu)
+        narrative_part = self.OBS_COMMENT_RE.sub('', narrative_part)
+        narrative_part = self.HIGHLIGHT_RE.sub(r'\1', narrative_part)
 
+        cleaned_lines = [line for line in narrative_part.split('\n') if line.strip()]
         narrative_text = '\n'.join(cleaned_lines)
 
         # Si le texte est trop court, retourner le body original (fallback)
@@ -196,14 +272,24 @@ class DocumentParser:
 
     def _clean_markdown(self, md: str) -> str:
         """Nettoie markdown"""
-        md = re.sub(
-            r'\[\[/?(id/(?:person|org|gpe|place)/[0-9a-fA-F-]{36})\|([^\]]+)\]\]',
-            r'\2 (/\1)',
-            md
-        )
-        md = re.sub(
-            r'\[\[/?(id/(?:person|org|gpe|place)/[0-9a-fA-F-]{36})\]\]',
-            r'(/\1)',
-            md
-        )
-        return md
\ No newline at end of file
+        md = self.WIKILINK_LABELED_RE.sub(r'\2 (/\1)', md)
+        md = self.WIKILINK_PLAIN_RE.sub(r'(/\1)', md)
+        return md
+
+
+def _parse_document_worker(vault_path: Path, file_path: Path, cached: Optional[Dict]):
+    """
+    Parsing d'un fichier, exécutable dans un process worker.
+    Retourne (payload, document sans id, warnings du fichier, erreur).
+    """
+    parser = DocumentParser(vault_path, {})
+    warnings = WikilinkWarnings()
+    payload = None
+
+    try:
+        payload, text = parser._load_document(file_path, cached)
+        if text is None:
+            return payload, None, warnings, None
+        return payload, parser._build_document(file_path, text, payload, warnings), warnings, None
+    except Exception as e:
+        return payload, None, warnings, f"{type(e).__name__}: {str(e)}"
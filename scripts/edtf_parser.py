@@ -15,6 +15,7 @@ comme intervalles standards. Validator signalera un warning.
 """
 
 from typing import Optional, Tuple
+from functools import lru_cache
 import re
 import calendar
 
@@ -22,6 +23,9 @@ import calendar
 class EDTFParser:
     """Parse dates EDTF et dérive dates normalisées"""
 
+    # Un seul match : lastgroup donne la précision (day / month / year)
+    DATE_RE = re.compile(r'^(?:(?P<day>\d{4}-\d{2}-\d{2})|(?P<month>\d{4}-\d{2})|(?P<year>\d{4}))$')
+
     @staticmethod
     def parse(edtf_string: str) -> Tuple[Optional[str], Optional[str], str]:
         """
@@ -32,6 +36,14 @@ class EDTFParser:
         if not edtf_string or edtf_string == "../..":
             return None, None, "unknown"
 
+        # Mêmes intervalles répétés dans tout le vault : résultat mémoïsé par chaîne
+        if isinstance(edtf_string, str):
+            return EDTFParser._parse_cached(edtf_string)
+        return EDTFParser._parse_cached.__wrapped__(edtf_string)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _parse_cached(edtf_string: str) -> Tuple[Optional[str], Optional[str], str]:
         edtf = edtf_string.strip()
 
         # Bornes ouvertes
@@ -69,14 +81,8 @@ class EDTFParser:
         date_end = EDTFParser._normalize_single_date(edtf, start=False)
 
         # Déterminer précision
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', edtf):
-            precision = "day"
-        elif re.match(r'^\d{4}-\d{2}$', edtf):
-            precision = "month"
-        elif re.match(r'^\d{4}$', edtf):
-            precision = "year"
-        else:
-            precision = "unknown"
+        m = EDTFParser.DATE_RE.match(edtf)
+        precision = m.lastgroup if m else "unknown"
 
         return date_start, date_end, precision
 
@@ -88,21 +94,27 @@ class EDTFParser:
 
         date_str = date_str.rstrip('~?')
 
+        m = EDTFParser.DATE_RE.match(date_str)
+        if not m:
+            return None
+
         # Année seule
-        if re.match(r'^\d{4}$', date_str):
+        if m.lastgroup == "year":
             return f"{date_str}-01-01" if start else f"{date_str}-12-31"
 
         # Année-Mois
-        if re.match(r'^\d{4}-\d{2}$', date_str):
-            year, month = date_str.split('-')
+        if m.lastgroup == "month":
             if start:
                 return f"{date_str}-01"
-            else:
-                last_day = calendar.monthrange(int(year), int(month))[1]
-                return f"{date_str}-{last_day:02d}"
+            year, month = date_str.split('-')
+            last_day = EDTFParser._last_day_of_month(int(year), int(month))
+            return f"{date_str}-{last_day:02d}"
 
         # Année-Mois-Jour
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-            return date_str
+        return date_str
 
-        return None
\ No newline at end of file
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _last_day_of_month(year: int, month: int) -> int:
+        """Dernier jour du mois (calendar.monthrange mémoïsé)"""
+        return calendar.monthrange(year, month)[1]
@@ -20,7 +20,9 @@ Caractéristiques
   si un second bloc-modèle est présent en bas de page); alias cumulés.
 """
 
-import re, unicodedata, json
+import re, unicodedata, json, os, hashlib, pickle
+from collections import defaultdict
+from functools import lru_cache
 from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Dict, List, Optional, Set
@@ -33,6 +35,18 @@ try:
 except Exception:
     yaml = None
 
+try:
+    from rapidfuzz import fuzz, process  # facultatif (ratio en C)
+except Exception:
+    fuzz = process = None
+
+if yaml:
+    try:
+        _YamlLoader = yaml.CSafeLoader  # LibYAML (C)
+    except AttributeError:
+        _YamlLoader = yaml.SafeLoader
+        print("[el.link.ocr] LibYAML indisponible : frontmatter parsé en pur Python")
+
 # =======================
 # Hyperparamètres simples
 # =======================
@@ -43,6 +57,8 @@ W_CONTEXT = 0.70
 BONUS_EXACT_MENTION = 25.0
 BONUS_SAME_TYPE = 8.0
 PENALTY_ZERO_TOKEN_OVERLAP = 15.0
+MAX_CANDIDATES = 200          # borne du blocking par tokens (postings les plus rares d'abord)
+KB_CACHE_VERSION = 2          # à incrémenter si _parse_md_entity/_make_aliases changent (cache JSON + snapshot)
 
 # ---- utilitaires flags/valeurs ----
 def _as_bool(v):
@@ -75,27 +91,57 @@ def _headword_group(tokens, groups):
 # -----------------
 # Normalisation / tokens
 # -----------------
+NON_WORD_PAT = re.compile(r"[^\w\s\-]+")
+SPACES_PAT = re.compile(r"\s+")
+
+STOP_TOK = frozenset({
+    "de","du","des","la","le","les","à","au","aux","en","d","l","et","pour","sur","dans",
+    "der","die","das","den","von","zu","zur","zum","im","in","am","und","mit",
+    "of","the","for","to","at","in","on","by","and","or"
+})
+
+class _CombiningFilter(dict):
+    """Table str.translate : supprime les diacritiques combinants (mémoïsé par code point)"""
+    def __missing__(self, cp):
+        out = None if unicodedata.combining(chr(cp)) else cp
+        self[cp] = out
+        return out
+
+_STRIP_COMBINING = _CombiningFilter()
+
+@lru_cache(maxsize=100_000)
 def _norm(s):
     s = unicodedata.normalize("NFKD", s or "")
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = s.translate(_STRIP_COMBINING)
     s = s.lower()
-    s = re.sub(r"[^\w\s\-]", " ", s)
-    s = re.sub(r"\s+", " ", s)
+    s = NON_WORD_PAT.sub(" ", s)
+    s = SPACES_PAT.sub(" ", s)
     return s.strip()
 
+def _norm_tokens(n):
+    """Tokens d'une chaîne déjà normalisée par _norm"""
+    return [t for t in n.split() if t and t not in STOP_TOK and len(t) > 1]
+
+@lru_cache(maxsize=100_000)
 def _tokens(s):
-    STOP_TOK = {
-        "de","du","des","la","le","les","à","au","aux","en","d","l","et","pour","sur","dans",
-        "der","die","das","den","von","zu","zur","zum","im","in","am","und","mit",
-        "of","the","for","to","at","in","on","by","and","or"
-    }
-    return [t for t in _norm(s).split() if t and t not in STOP_TOK and len(t) > 1]
+    return tuple(_norm_tokens(_norm(s)))
 
 def _ratio(a, b):
     if not a or not b:
         return 0.0
+    if fuzz:
+        return fuzz.ratio(a, b) / 100.0
     return SequenceMatcher(None, a, b).ratio()
 
+def _best_ratio(query, choices):
+    """max(_ratio(query, c) for c in choices), calculé en C si rapidfuzz est dispo"""
+    if not query or not choices:
+        return 0.0
+    if process:
+        best = process.extractOne(query, choices, scorer=fuzz.ratio, processor=None)
+        return best[1] / 100.0 if best else 0.0
+    return max((_ratio(query, c) for c in choices), default=0.0)
+
 def _context_window(text, start, end, radius=CTX_RADIUS):
     a = max(0, start - radius)
     b = min(len(text), end + radius)
@@ -112,9 +158,59 @@ ALIAS_DE_PAT = re.compile(r"alias\s*\(de\)\s*:\s*(.+)", re.I)
 ID_LINE_PAT  = re.compile(r"^\s*(?:\*\*)?\s*ID\s*(?:\*\*)?\s*:\s*(/id/[\w/\-]+)", re.I)
 H1_TITLE_PAT = re.compile(r"^\s*#\s+(.+?)\s*$")
 
+BOLD_PAT     = re.compile(r"\*\*(.*?)\*\*")
+BULLET_PAT   = re.compile(r"^\-\s*")
+YAML_ID_PAT  = re.compile(r'^\s*id\s*:\s*"?([^"\n]+)"?\s*$', re.M)
+YAML_KV_PAT  = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)[ \t]*:(?:[ \t]+(.*?))?[ \t]*$")
+YAML_DQ_PAT  = re.compile(r'^"([^"\\]*)"$')
+YAML_SQ_PAT  = re.compile(r"^'([^']*)'$")
+YAML_PLAIN_FIRST_BAD = set("-?:,[]{}#&*!|>'\"%@`")
+YAML_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_RESOLVER = yaml.resolver.Resolver() if yaml else None
+
+def _yaml_plain_str(v):
+    """True si v est un scalaire YAML simple résolu en chaîne (pas int/bool/date/null…)"""
+    if v[0] in YAML_PLAIN_FIRST_BAD or ": " in v or " #" in v or v.endswith(":"):
+        return False
+    return _YAML_RESOLVER.resolve(yaml.ScalarNode, v, (True, False)) == YAML_STR_TAG
+
+def _fast_yaml_kv(yml_text):
+    """
+    Fast-path pour frontmatter "clé: scalaire" à plat (cas des fiches KB).
+    Retourne None dès qu'une ligne sort de ce schéma (listes, blocs, flow, typage
+    implicite…) → parsing YAML complet.
+    """
+    if "\r" in yml_text or yaml.reader.Reader.NON_PRINTABLE.search(yml_text):
+        return None
+    data = {}
+    for line in yml_text.split("\n"):
+        if not line.strip() or line.startswith("#"):
+            continue
+        m = YAML_KV_PAT.match(line)
+        if not m or not _yaml_plain_str(m.group(1)):
+            return None
+        key, v = m.group(1), m.group(2) or ""
+        if not v:
+            data[key] = None
+        elif v[0] == '"':
+            q = YAML_DQ_PAT.match(v)
+            if not q:
+                return None
+            data[key] = q.group(1)
+        elif v[0] == "'":
+            q = YAML_SQ_PAT.match(v)
+            if not q:
+                return None
+            data[key] = q.group(1)
+        elif _yaml_plain_str(v):
+            data[key] = v
+        else:
+            return None
+    return data
+
 def _strip_md(s):
-    s = re.sub(r"\*\*(.*?)\*\*", r"\1", s)  # enlève **bold**
-    s = re.sub(r"^\-\s*", "", s)            # enlève "- " puces
+    s = BOLD_PAT.sub(r"\1", s)    # enlève **bold**
+    s = BULLET_PAT.sub("", s)      # enlève "- " puces
     return s.strip()
 
 def _extract_yaml_block(txt):
@@ -133,14 +229,17 @@ def _extract_yaml_block(txt):
     yml_text = "\n".join(parts[1:end_idx])
     rest = "\n".join(parts[end_idx+1:])
     if yaml:
+        data = _fast_yaml_kv(yml_text)
+        if data is not None:
+            return data, rest
         try:
-            data = yaml.safe_load(yml_text) or {}
+            data = yaml.load(yml_text, Loader=_YamlLoader) or {}
             if isinstance(data, dict):
                 return data, rest
         except Exception:
             pass
     # fallback: id: "/id/…"
-    m = re.search(r'^\s*id\s*:\s*"?([^"\n]+)"?\s*$', yml_text, flags=re.M)
+    m = YAML_ID_PAT.search(yml_text)
     data = {"id": m.group(1).strip()} if m else {}
     return data, rest
 
@@ -154,8 +253,10 @@ def _infer_type_from_id(kid):
         return "GPE"
     return ""
 
+_ALIAS_DELIMS = str.maketrans(",|", ";;")
+
 def _split_aliases(s):
-    return [a.strip() for a in re.split(r"[;,|]", s or "") if a.strip()]
+    return [a for a in map(str.strip, (s or "").translate(_ALIAS_DELIMS).split(";")) if a]
 
 def _parse_md_entity(path):
     """Lit une fiche et renvoie un dict {id,type,prefLabel_fr,prefLabel_de,altLabel_fr,altLabel_de}.
@@ -230,33 +331,149 @@ def _parse_md_entity(path):
     }
 
 def _make_aliases(row):
+    """Alias bruts (+ MAJ), formes normalisées et tokens, en une passe sur les labels"""
     aliases = set()
+    aliases_norm = set()
+    alias_tokens = set()
     for k in ("prefLabel_fr","prefLabel_de","altLabel_fr","altLabel_de"):
         val = (row.get(k) or "").replace("|",";")
-        for a in [x.strip() for x in val.split(";") if x.strip()]:
+        for a in val.split(";"):
+            a = a.strip()
+            if not a or a in aliases:
+                continue
+            up = a.upper()
             aliases.add(a)
-            aliases.add(a.upper())
-    aliases_norm = {_norm(a) for a in aliases if a.strip()}
-    alias_tokens = set()
-    for a in aliases:
-        alias_tokens.update(_tokens(a))
-    return sorted(aliases), sorted(a for a in aliases_norm if a), alias_tokens
+            aliases.add(up)
+            # _norm met en minuscules : la forme MAJ n'apporte rien sauf expansion (ß → SS)
+            forms = (a, up) if up.lower() != a.lower() else (a,)
+            for form in forms:
+                n = _norm(form)
+                if n and n not in aliases_norm:
+                    aliases_norm.add(n)
+                    alias_tokens.update(_norm_tokens(n))
+    return tuple(sorted(aliases)), frozenset(aliases_norm), frozenset(alias_tokens)
+
+# ----------------------------
+# Cache fiches (relpath, mtime, taille)
+# ----------------------------
+# Format {"version": KB_CACHE_VERSION, "entries": {relpath: [mtime_ns, taille, row]}} :
+# les rows d'une version antérieure de _parse_md_entity sont ignorées
+def _load_parse_cache(path):
+    if not path:
+        return {}
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != KB_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+def _save_parse_cache(path, entries):
+    if not path:
+        return
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        data = {"version": KB_CACHE_VERSION, "entries": entries}
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _iter_md(root):
+    """Équivalent rapide de Path(root).rglob("*.md") via os.scandir"""
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+            elif e.name.endswith(".md"):
+                yield e
+        stack.extend(reversed(subdirs))
+
+def _kb_fingerprint(files):
+    sig = sorted((rel, st.st_mtime_ns, st.st_size) for _, rel, st in files)
+    return hashlib.sha1(repr((KB_CACHE_VERSION, sig)).encode("utf-8")).hexdigest()
+
+def _load_kb_snapshot(path, fingerprint):
+    try:
+        with open(path, "rb") as f:
+            snap = pickle.load(f)
+        if snap.get("fingerprint") == fingerprint:
+            return snap["kb"]
+    except Exception:
+        pass
+    return None
 
-def load_kb_obsidian(root_dir):
+def _save_kb_snapshot(path, fingerprint, kb):
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"fingerprint": fingerprint, "kb": kb}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def load_kb_obsidian(root_dir, cache_path=None):
     """
     Parcourt <root>/id/**/*.md et indexe les fiches.
+    Si cache_path est fourni, les fiches inchangées (mtime/taille) ne sont pas relues,
+    et si aucune fiche n'a changé, la KB indexée est rechargée telle quelle (<cache>.pkl).
     Retourne:
       - items: id -> row (+ _aliases / _aliases_norm / _alias_tokens)
       - alias_index: alias_norm -> set(ids)  (tous types)
       - token_index: token -> set(ids)       (tous types)
     """
     items: Dict[str, Dict[str, str]] = {}
-    alias_index: Dict[str, Set[str]] = {}
-    token_index: Dict[str, Set[str]] = {}
+    alias_index: Dict[str, Set[str]] = defaultdict(set)
+    token_index: Dict[str, Set[str]] = defaultdict(set)
+
+    cache = _load_parse_cache(cache_path)
+    fresh = {}
 
     root = Path(root_dir) / "id"
-    for p in root.rglob("*.md"):
-        row = _parse_md_entity(p)
+    root_prefix = len(str(root)) + 1
+    files, rows, todo = [], [], []
+    for entry in _iter_md(root):
+        rel = entry.path[root_prefix:]
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        cached = cache.get(rel)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            rows.append(cached[2])
+        else:
+            rows.append(None)
+            todo.append(len(files))
+        files.append((entry.path, rel, st))
+
+    snapshot_path = Path(cache_path).with_suffix(".pkl") if cache_path else None
+    fingerprint = _kb_fingerprint(files) if snapshot_path else None
+    if snapshot_path:
+        kb = _load_kb_snapshot(snapshot_path, fingerprint)
+        if kb is not None:
+            return kb
+
+    # Fiches nouvelles/modifiées seulement. Pas de process pool : chargé par Prodigy (-F),
+    # ce module n'est pas importable par nom, _parse_md_entity ne peut pas être envoyé à un worker
+    for i in todo:
+        rows[i] = _parse_md_entity(Path(files[i][0]))
+
+    for (_, rel, st), row in zip(files, rows):
+        fresh[rel] = [st.st_mtime_ns, st.st_size, dict(row) if row else None]
         if not row:
             continue
         rid = (row.get("id") or "").strip()
@@ -270,11 +487,17 @@ def load_kb_obsidian(root_dir):
         items[rid] = row
 
         for an in aliases_norm:
-            alias_index.setdefault(an, set()).add(rid)
+            alias_index[an].add(rid)
         for tok in alias_toks:
-            token_index.setdefault(tok, set()).add(rid)
+            token_index[tok].add(rid)
 
-    return items, alias_index, token_index
+    if cache_path and fresh != cache:
+        _save_parse_cache(cache_path, fresh)
+
+    kb = (items, dict(alias_index), dict(token_index))
+    if snapshot_path:
+        _save_kb_snapshot(snapshot_path, fingerprint, kb)
+    return kb
 
 # -----------------
 # Classement
@@ -288,30 +511,52 @@ def _rank(mention, ctx_text, items, alias_index, token_index,
     groups = groups or []
     m_norm = _norm(mention)
     c_norm = _norm(ctx_text)
-    m_toks = set(_tokens(mention))
-
-    # blocking par tokens + alias exact normalisé
-    cand_ids = set()
-    for t in m_toks:
-        cand_ids |= token_index.get(t, set())
-    cand_ids |= alias_index.get(m_norm, set())
-    if not cand_ids:
-        cand_ids = set(items.keys())
+    c_toks = frozenset(_norm_tokens(c_norm))
+    m_toks = frozenset(_tokens(mention))
 
-    # restreindre si demandé
+    # alias exact normalisé : seuls ces candidats sont classés (pas de blocking flou)
+    cand_ids = set(alias_index.get(m_norm, ()))
     if strict_type:
         cand_ids = {rid for rid in cand_ids if (items[rid].get("type") or "").upper() == target_type}
 
+    if not cand_ids:
+        # blocking par tokens : union des postings du plus rare au plus fréquent tant
+        # qu'elle reste sous MAX_CANDIDATES, puis intersection si le plus rare est déjà trop gros
+        postings = [token_index[t] for t in m_toks if t in token_index]
+        if strict_type:
+            # filtrer avant le plafonnement : sinon le pool borné peut ne contenir aucun candidat du type
+            postings = [{rid for rid in post if (items[rid].get("type") or "").upper() == target_type}
+                        for post in postings]
+        postings.sort(key=len)
+        for post in postings:
+            if cand_ids and len(cand_ids) + len(post) > MAX_CANDIDATES:
+                break
+            cand_ids |= post
+        if len(cand_ids) > MAX_CANDIDATES:
+            for post in postings[1:]:
+                narrowed = cand_ids & post
+                if narrowed:
+                    cand_ids = narrowed
+                if len(cand_ids) <= MAX_CANDIDATES:
+                    break
+        if not cand_ids:
+            cand_ids = set(items.keys())
+
+        # restreindre si demandé
+        if strict_type:
+            cand_ids = {rid for rid in cand_ids if (items[rid].get("type") or "").upper() == target_type}
+
     want_group = _headword_group(m_toks, groups) if groups else None
 
     ranked = []
     for rid in cand_ids:
         row = items[rid]
-        aliases_norm = row.get("_aliases_norm", [])
-        alias_toks   = row.get("_alias_tokens", set())
+        aliases_norm = row.get("_aliases_norm", frozenset())
+        alias_toks   = row.get("_alias_tokens", frozenset())
 
-        best_m = max((_ratio(m_norm, an) for an in aliases_norm), default=0.0)
-        best_c = max((_ratio(c_norm, an) for an in aliases_norm), default=0.0)
+        best_m = _best_ratio(m_norm, aliases_norm)
+        # contexte sans aucun token commun avec la fiche : pas de fuzzy sur le contexte
+        best_c = 0.0 if c_toks.isdisjoint(alias_toks) else _best_ratio(c_norm, aliases_norm)
         score = (W_MENTION * best_m + W_CONTEXT * best_c) * 100.0
 
         # bonus exact mention
@@ -389,7 +634,9 @@ def el_link_ocr(dataset, source, obsidian_root,
 
     groups = _load_headword_groups(headword_groups) if _as_bool(enable_headwords) else []
 
-    items, alias_index, token_index = load_kb_obsidian(obsidian_root)
+    items, alias_index, token_index = load_kb_obsidian(
+        obsidian_root, cache_path=Path(obsidian_root) / ".cache" / "el_kb.json"
+    )
 
     def make_examples(stream):
         for ex in stream:
@@ -6,22 +6,139 @@ Version: 2.4.0 - Structures réifiées depuis markdown + frontmatter
 
 import yaml
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Set, Tuple, Optional
 from .entity_parser_markdown import parse_structures_from_markdown
 from .wikilink_extractor import WikilinkExtractor, WikilinkWarnings
 from .edtf_parser import EDTFParser
+from .records import StructureItem
+from .vault_scan import VaultIndex, markdown_files
+from .parallel import map_jobs
+
+# LibYAML (C) si disponible, sinon fallback pur Python
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 
 class EntityParser:
     """Parse les notes d'entités depuis Obsidian"""
 
     ENTITY_FOLDERS = ["id/gpe", "id/person", "id/org", "id/place"]
-
-    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None):
+    FOLDER_LABELS = {"id/gpe": "GPE", "id/person": "Person", "id/org": "Organization", "id/place": "GPE"}
+
+    # Nettoyage des notices, une seule passe :
+    # \n{3,} → \n\n, [[/id/...]] → supprimé, [[cible|texte]] → texte, [[texte]] → texte
+    NOTICE_CLEAN_RE = re.compile(
+        r'(\n{3,})|\[\[/id/[^\]]+\]\]|\[\[[^\]|]+\|([^\]]+)\]\]|\[\[([^\]]+)\]\]'
+    )
+    NOTICE_SPACES_RE = re.compile(r'  +')
+
+    # Structures markdown → (id dans 'properties' ?, clé de l'id lié, relation spécifique)
+    STRUCTURE_LINKS = {
+        'occupations': (True, 'organization', 'WORKED_FOR'),
+        'family_relations': (False, 'target_id', None),
+        'professional_relations': (False, 'target_id', None),
+        'origins': (True, 'place', None),
+    }
+
+    # Propriétés copiées du frontmatter : (clé, valeur par défaut)
+    # list = fabrique : une liste neuve par entité, jamais partagée
+    BASE_PROPERTIES = (
+        ('prefLabel_fr', ''),
+        ('prefLabel_de', ''),
+        ('aliases', list),
+        ('sameAs', list),
+        ('status', 'active'),
+    )
+    LABEL_PROPERTIES = {
+        'Organization': (('type', ''),),
+        'GPE': (('geonames_id', None),),
+    }
+
+    # Notice extraite du corps : label → (propriété, titre de section)
+    NOTICE_SECTIONS = {
+        'Person': ('notice_bio', "Notice biographique"),
+        'Organization': ('notice_institutionnelle', "Notice institutionnelle"),
+        'GPE': ('notice_geo', "Notice géographique"),
+    }
+
+    # Coordonnées GPE au format liste ('lat 53.8655', 'lon 10.6866')
+    COORDINATE_KEYS = {'lat': 'coordinates_lat', 'lon': 'coordinates_lon'}
+
+    # Traitement spécifique par label (méthode appelée une fois par fichier)
+    LABEL_HANDLERS = {
+        'Person': '_parse_person_fields',
+        'GPE': '_parse_gpe_fields',
+    }
+
+    # Structures réifiées du frontmatter Person : (clé frontmatter, clé structure)
+    PERSON_FRONTMATTER_STRUCTURES = (
+        ('occupations', 'occupations'),
+        ('names', 'names'),
+        ('origins', 'origins'),
+        ('relations_family', 'family_relations'),
+        ('professional_relations', 'professional_relations'),
+    )
+
+    # Description de chaque structure :
+    # - fields / defaults : champs copiés tels quels (defaults : valeur si absent)
+    # - target : champ résolu en 'target_id' au niveau de l'item
+    # - links : champs wikilink résolus via clean_id dans les propriétés
+    # - parts : sous-champs de 'parts' copiés en parts_<clé>
+    # - provenance : champs copiés depuis le bloc provenance
+    # - collect / relation : ID lié collecté, et relation spécifique alimentée
+    FRONTMATTER_STRUCTURES = {
+        'occupations': {
+            'fields': ('type_activity', 'position_title'),
+            'links': ('organization',),
+            'provenance': ('doc', 'page', 'quote', 'evidence_type', 'confidence'),
+            'collect': 'organization',
+            'relation': 'WORKED_FOR',
+        },
+        'names': {
+            'fields': ('display', 'lang', 'type'),
+            'parts': ('family', 'given', 'particle'),
+            'provenance': ('doc', 'quote', 'evidence_type', 'confidence'),
+        },
+        'origins': {
+            'fields': ('mode',),
+            'defaults': {'is_primary': False},
+            'links': ('place',),
+            'provenance': ('doc', 'quote', 'evidence_type', 'confidence'),
+        },
+        'family_relations': {
+            'fields': ('relation_type',),
+            'target': 'target',
+            'provenance': ('doc', 'quote', 'evidence_type', 'confidence'),
+            'collect': 'target',
+        },
+        'professional_relations': {
+            'fields': ('relation_type',),
+            'target': 'target',
+            'links': ('organization_context',),
+            'provenance': ('doc', 'quote', 'evidence_type', 'confidence'),
+            'collect': 'target',
+        },
+    }
+
+    # Mention is_part_of dans le corps (insensible à la casse, sans copie en minuscules)
+    IS_PART_OF_RE = re.compile(r'is_part_of', re.IGNORECASE)
+
+    # Clé id: en début de ligne du frontmatter brut (pré-filtre avant YAML)
+    FRONTMATTER_ID_RE = re.compile(r'^[\'"]?id[\'"]?\s*:', re.MULTILINE)
+
+    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None,
+                 workers: Optional[int] = None, vault_index: Optional[VaultIndex] = None):
         self.vault_path = vault_path
         self.config = config
         self.folders = folders
+        self.workers = workers
+        self.vault_index = vault_index
+        # IDs résolus sans warning pour le fichier en cours (vidé par _parse_entity_file, voir _clean_id)
+        self._clean_cache: Dict[str, str] = {}
 
     def _should_process_file(self, file_path: Path) -> bool:
         """Les entités sont toujours importées si folders spécifié pour sources"""
@@ -32,36 +149,50 @@ class EntityParser:
         entities = []
         warnings = WikilinkWarnings()
 
+        jobs = []
         for folder in self.ENTITY_FOLDERS:
             folder_path = self.vault_path / folder
             if not folder_path.exists():
                 continue
 
-            for file_path in folder_path.rglob("*.md"):
-                if not self._should_process_file(file_path):
-                    continue
+            label = self.FOLDER_LABELS[folder]
+            for file_path in markdown_files(folder_path, self.vault_index):
+                if self._should_process_file(file_path):
+                    jobs.append((self.vault_path, file_path, label))
 
-                try:
-                    entity = self._parse_entity_file(file_path, warnings)
-                    if entity:
-                        entities.append(entity)
-                except Exception as e:
-                    warnings.log_parse_error(str(file_path), f"{type(e).__name__}: {str(e)}")
+        results = map_jobs(_parse_entity_worker, jobs, self.workers)
+
+        for (_, file_path, _), (entity, file_warnings, error) in zip(jobs, results):
+            warnings.merge(file_warnings)
+            if entity:
+                entities.append(entity)
+            if error:
+                warnings.log_parse_error(str(file_path), error)
 
         return entities, warnings
 
-    def _parse_entity_file(self, file_path: Path, warnings: WikilinkWarnings) -> Optional[Dict[str, Any]]:
-        """Parse un fichier entité"""
-        text = file_path.read_text(encoding='utf-8')
+    def _parse_entity_file(self, file_path: Path, warnings: WikilinkWarnings,
+                           label: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Parse un fichier entité (label déduit du dossier si non fourni)"""
+        if label is None:
+            label = self._get_label(file_path)
+        if label == "Entity":
+            return None
 
-        frontmatter_text, body = self._split_frontmatter_raw(text)
-        frontmatter = yaml.safe_load(frontmatter_text) if frontmatter_text else {}
+        self._clean_cache.clear()
 
-        if not frontmatter or 'id' not in frontmatter:
+        text = file_path.read_bytes().decode('utf-8')
+        if '\r' in text:
+            # Mêmes fins de ligne que read_text() (newlines universels)
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        frontmatter_text, body = self._split_frontmatter_raw(text)
+        if not frontmatter_text or not self.FRONTMATTER_ID_RE.search(frontmatter_text):
             return None
 
-        label = self._get_label(file_path)
-        if label == "Entity":
+        frontmatter = yaml.load(frontmatter_text, Loader=_SafeLoader)
+
+        if not frontmatter or 'id' not in frontmatter:
             return None
 
         entity_id = WikilinkExtractor.clean_id(frontmatter['id'], warnings, str(file_path))
@@ -71,18 +202,17 @@ class EntityParser:
             WikilinkExtractor.validate_frontmatter_syntax(frontmatter_text, warnings, str(file_path))
 
         # Détecter is_part_of dans corps
-        if 'is_part_of' in body.lower():
+        if self.IS_PART_OF_RE.search(body):
             warnings.log_is_part_of_in_body(str(file_path), entity_id)
 
         # Extraire wikilinks
-        all_links_text = WikilinkExtractor.extract_all_wikilinks(body, warnings, str(file_path))
-        all_links_fm = WikilinkExtractor.extract_from_dict(
+        all_links = WikilinkExtractor.extract_all_wikilinks(body, warnings, str(file_path))
+        all_links.update(WikilinkExtractor.extract_from_dict(
             frontmatter,
             WikilinkExtractor.FRONTMATTER_BLACKLIST,
             warnings,
             str(file_path)
-        )
-        all_links = all_links_text | all_links_fm
+        ))
 
         specific_links = set()
         specific_relations = {}
@@ -117,35 +247,32 @@ class EntityParser:
                 specific_relations['IS_PART_OF'] = parent_ids
 
         # ============================================================================
-        # STRUCTURES RÉIFIÉES - Phase 1 : Frontmatter (legacy)
+        # PROPRIÉTÉS DE BASE
         # ============================================================================
-        structures = {}
-
-        if label == "Person":
-            if 'occupations' in frontmatter and isinstance(frontmatter.get('occupations'), list):
-                occs, worked_for_ids = self._parse_occupations(frontmatter['occupations'], warnings, str(file_path))
-                structures['occupations'] = occs
-                specific_links.update(worked_for_ids)
-                if worked_for_ids:
-                    specific_relations['WORKED_FOR'] = list(worked_for_ids)
-
-            if 'names' in frontmatter and isinstance(frontmatter.get('names'), list):
-                structures['names'] = self._parse_names(frontmatter['names'], entity_id)
+        property_specs = self.BASE_PROPERTIES + self.LABEL_PROPERTIES.get(label, ())
+        properties = {
+            key: frontmatter[key] if key in frontmatter else (default() if default is list else default)
+            for key, default in property_specs
+        }
 
-            if 'origins' in frontmatter and isinstance(frontmatter.get('origins'), list):
-                structures['origins'] = self._parse_origins(frontmatter['origins'], warnings, str(file_path))
+        # ✨ Extraire notices du corps markdown
+        notice_spec = self.NOTICE_SECTIONS.get(label)
+        if notice_spec:
+            notice_key, section_title = notice_spec
+            notice = self._extract_notice_section(body, section_title)
+            if notice:
+                properties[notice_key] = notice
 
-            if 'relations_family' in frontmatter and isinstance(frontmatter.get('relations_family'), list):
-                rels, family_ids = self._parse_family_relations(frontmatter['relations_family'], warnings,
-                                                                str(file_path))
-                structures['family_relations'] = rels
-                specific_links.update(family_ids)
+        # ============================================================================
+        # STRUCTURES RÉIFIÉES - Phase 1 : Frontmatter (legacy)
+        # ============================================================================
+        structures = {}
 
-            if 'professional_relations' in frontmatter and isinstance(frontmatter.get('professional_relations'), list):
-                rels, prof_ids = self._parse_professional_relations(frontmatter['professional_relations'], warnings,
-                                                                    str(file_path))
-                structures['professional_relations'] = rels
-                specific_links.update(prof_ids)
+        # Traitements propres au label (structures Person, coordonnées GPE)
+        label_handler = self.LABEL_HANDLERS.get(label)
+        if label_handler:
+            getattr(self, label_handler)(frontmatter, properties, structures, specific_links,
+                                         specific_relations, warnings, str(file_path))
 
         # ============================================================================
         # STRUCTURES RÉIFIÉES - Phase 2 : Corps Markdown (NEW!)
@@ -157,108 +284,34 @@ class EntityParser:
         )
 
         # Fusionner structures frontmatter + markdown
+        relation_seen = {}  # relation → set des IDs déjà présents dans la liste (dédoublonnage O(1))
         for struct_key, items in markdown_structures.items():
-            if struct_key not in structures:
-                structures[struct_key] = []
-            structures[struct_key].extend(items)
+            structures.setdefault(struct_key, []).extend(items)
 
             # Extraire IDs pour relations spécifiques
-            if struct_key == 'occupations':
-                for item in items:
-                    org_id = item['properties'].get('organization')
-                    if org_id:
-                        specific_links.add(org_id)
-                        if 'WORKED_FOR' not in specific_relations:
-                            specific_relations['WORKED_FOR'] = []
-                        if org_id not in specific_relations['WORKED_FOR']:
-                            specific_relations['WORKED_FOR'].append(org_id)
-
-            elif struct_key == 'family_relations':
-                for item in items:
-                    target_id = item.get('target_id')
-                    if target_id:
-                        specific_links.add(target_id)
-
-            elif struct_key == 'professional_relations':
-                for item in items:
-                    target_id = item.get('target_id')
-                    if target_id:
-                        specific_links.add(target_id)
-
-            elif struct_key == 'origins':
-                for item in items:
-                    place_id = item['properties'].get('place')
-                    if place_id:
-                        specific_links.add(place_id)
+            link_spec = self.STRUCTURE_LINKS.get(struct_key)
+            if not link_spec:
+                continue
+
+            in_properties, id_key, relation = link_spec
+            for item in items:
+                linked_id = (item['properties'] if in_properties else item).get(id_key)
+                if not linked_id:
+                    continue
+                specific_links.add(linked_id)
+                if relation:
+                    seen = relation_seen.get(relation)
+                    if seen is None:
+                        seen = relation_seen[relation] = set(specific_relations.setdefault(relation, []))
+                    if linked_id not in seen:
+                        seen.add(linked_id)
+                        specific_relations[relation].append(linked_id)
 
         # ============================================================================
         # RELATIONS GÉNÉRIQUES
         # ============================================================================
         _, generic_refs = WikilinkExtractor.categorize_links(all_links, specific_links, entity_id)
 
-        # ============================================================================
-        # PROPRIÉTÉS DE BASE
-        # ============================================================================
-        properties = {
-            'prefLabel_fr': frontmatter.get('prefLabel_fr', ''),
-            'prefLabel_de': frontmatter.get('prefLabel_de', ''),
-            'aliases': frontmatter.get('aliases', []),
-            'sameAs': frontmatter.get('sameAs', []),
-            'status': frontmatter.get('status', 'active')
-        }
-
-        # ✨ Extraire notices du corps markdown
-        if label == "Person":
-            notice_bio = self._extract_notice_section(body, "Notice biographique")
-            if notice_bio:
-                properties['notice_bio'] = notice_bio
-
-        elif label == "Organization":
-            notice_inst = self._extract_notice_section(body, "Notice institutionnelle")
-            if notice_inst:
-                properties['notice_institutionnelle'] = notice_inst
-
-            properties['type'] = frontmatter.get('type', '')
-
-        elif label == "GPE":
-            notice_geo = self._extract_notice_section(body, "Notice géographique")
-            if notice_geo:
-                properties['notice_geo'] = notice_geo
-
-        # Type pour Organisation
-        if label == "Organization":
-            properties['type'] = frontmatter.get('type', '')
-
-        # ✨ FIX v2.3.2 : Support format liste Obsidian-friendly pour coordonnées GPE
-        if label == "GPE":
-            if 'coordinates' in frontmatter and frontmatter['coordinates']:
-                coords = frontmatter['coordinates']
-
-                if isinstance(coords, list):
-                    # Parser format: ['system WGS84', 'lat 53.8655', 'lon 10.6866']
-                    for item in coords:
-                        if isinstance(item, str):
-                            item_lower = item.lower().strip()
-                            if item_lower.startswith('lat '):
-                                try:
-                                    lat_str = item.split(None, 1)[1]  # Split sur whitespace
-                                    properties['coordinates_lat'] = float(lat_str)
-                                except (ValueError, IndexError):
-                                    pass
-                            elif item_lower.startswith('lon '):
-                                try:
-                                    lon_str = item.split(None, 1)[1]
-                                    properties['coordinates_lon'] = float(lon_str)
-                                except (ValueError, IndexError):
-                                    pass
-
-                elif isinstance(coords, dict):
-                    # Support ancien format dictionnaire (backward compatible)
-                    properties['coordinates_lat'] = coords.get('lat')
-                    properties['coordinates_lon'] = coords.get('lon')
-
-            properties['geonames_id'] = frontmatter.get('geonames_id')
-
         return {
             'label': label,
             'id': entity_id,
@@ -268,16 +321,62 @@ class EntityParser:
             'generic_references': generic_refs
         }
 
+    def _parse_person_fields(self, frontmatter: Dict, properties: Dict, structures: Dict,
+                             specific_links: Set[str], specific_relations: Dict,
+                             warnings: WikilinkWarnings, file_path: str):
+        """Person : structures réifiées du frontmatter (legacy)"""
+        for fm_key, struct_key in self.PERSON_FRONTMATTER_STRUCTURES:
+            data = frontmatter.get(fm_key)
+            if type(data) is not list:
+                continue
+
+            items, linked_ids = self._parse_structure_list(struct_key, data, warnings, file_path)
+            structures[struct_key] = items
+            specific_links.update(linked_ids)
+
+            relation = self.FRONTMATTER_STRUCTURES[struct_key].get('relation')
+            if relation and linked_ids:
+                specific_relations[relation] = list(linked_ids)
+
+    def _parse_gpe_fields(self, frontmatter: Dict, properties: Dict, structures: Dict,
+                          specific_links: Set[str], specific_relations: Dict,
+                          warnings: WikilinkWarnings, file_path: str):
+        """GPE : coordonnées (✨ FIX v2.3.2 : format liste Obsidian-friendly)"""
+        if 'coordinates' in frontmatter and frontmatter['coordinates']:
+            coords = frontmatter['coordinates']
+
+            if isinstance(coords, list):
+                # Parser format: ['system WGS84', 'lat 53.8655', 'lon 10.6866']
+                for item in coords:
+                    if not isinstance(item, str):
+                        continue
+                    key, sep, value = item.strip().partition(' ')
+                    # Seules des clés de 3 lettres (lat/lon) comptent : pas de lower() sur le reste
+                    if not sep or len(key) != 3:
+                        continue
+                    coord_key = self.COORDINATE_KEYS.get(key.lower())
+                    if coord_key:
+                        try:
+                            properties[coord_key] = float(value)
+                        except ValueError:
+                            pass
+
+            elif isinstance(coords, dict):
+                # Support ancien format dictionnaire (backward compatible)
+                properties['coordinates_lat'] = coords.get('lat')
+                properties['coordinates_lon'] = coords.get('lon')
+
     def _split_frontmatter_raw(self, text: str) -> Tuple[str, str]:
         """Sépare frontmatter brut et corps"""
         if not text.startswith('---'):
             return '', text
 
-        parts = text.split('---', 2)
-        if len(parts) < 3:
+        # Mêmes bornes que text.split('---', 2), sans découper tout le texte
+        end = text.find('---', 3)
+        if end == -1:
             return '', text
 
-        return parts[1], parts[2].lstrip('\n')
+        return text[3:end], text[end + 3:].lstrip('\n')
 
     def _get_label(self, path: Path) -> str:
         """Détermine le label Neo4j depuis le chemin"""
@@ -294,6 +393,19 @@ class EntityParser:
                     return 'GPE'
         return 'Entity'
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _section_re(section_title: str) -> re.Pattern:
+        """Pattern ## Section jusqu'à la prochaine section ## (compilé une fois par titre)"""
+        return re.compile(rf'##\s+{re.escape(section_title)}\s*\n(.*?)(?=\n##|\Z)', re.DOTALL)
+
+    @staticmethod
+    def _notice_replacement(match: re.Match) -> str:
+        """Remplacement NOTICE_CLEAN_RE : \n\n, texte du wikilink, ou vide pour [[/id/...]]"""
+        if match.lastindex == 1:
+            return '\n\n'
+        return match.group(match.lastindex) if match.lastindex else ''
+
     def _extract_notice_section(self, body: str, section_title: str) -> Optional[str]:
         """
         ✨ NOUVEAU : Extrait le contenu d'une section markdown
@@ -305,223 +417,109 @@ class EntityParser:
         Returns:
             Contenu de la section nettoyé, ou None si non trouvé
         """
-        # Pattern pour trouver ## Section jusqu'à la prochaine section ##
-        pattern = rf'##\s+{re.escape(section_title)}\s*\n(.*?)(?=\n##|\Z)'
-
-        match = re.search(pattern, body, re.DOTALL)
+        match = self._section_re(section_title).search(body)
         if match:
             content = match.group(1).strip()
 
             # Nettoyer :
-            # - Enlever excès de sauts de ligne
-            content = re.sub(r'\n{3,}', '\n\n', content)
-
-            # - Enlever wikilinks mais garder le texte
-            content = re.sub(r'\[\[/id/[^\]]+\]\]', '', content)
-            content = re.sub(r'\[\[([^\]|]+)\|([^\]]+)\]\]', r'\2', content)
-            content = re.sub(r'\[\[([^\]]+)\]\]', r'\1', content)
+            # - Réduire les sauts de ligne, enlever wikilinks mais garder le texte
+            if '[[' in content or '\n\n\n' in content:
+                content = self.NOTICE_CLEAN_RE.sub(self._notice_replacement, content)
 
-            # - Nettoyer espaces multiples
-            content = re.sub(r'  +', ' ', content)
+            # - Nettoyer espaces multiples (après retrait des liens : 'a [[/id/x]] b' → 'a b')
+            if '  ' in content:
+                content = self.NOTICE_SPACES_RE.sub(' ', content)
 
             return content if len(content) > 10 else None
 
         return None
 
-    def _parse_occupations(self, occs_data: List[Dict], warnings: WikilinkWarnings, file_path: str) -> Tuple[
-        List[Dict], Set[str]]:
-        """Parse occupations avec extraction org_id"""
-        occupations = []
-        org_ids = set()
-
-        for occ in occs_data:
-            org_raw = occ.get('organization')
-            org_id = None
-            if org_raw:
-                try:
-                    org_id = WikilinkExtractor.clean_id(org_raw, warnings, file_path)
-                    org_ids.add(org_id)
-                except (ValueError, TypeError):
-                    pass
-
-            interval = occ.get('interval', '')
-            date_start, date_end, precision = EDTFParser.parse(interval)
-
-            provenance = occ.get('provenance', {}) or {}
-
-            occupations.append({
-                'rid': occ.get('rid'),
-                'properties': {
-                    'type_activity': occ.get('type_activity'),
-                    'organization': org_id,
-                    'position_title': occ.get('position_title'),
-                    'interval': interval,
-                    'date_start': date_start,
-                    'date_end': date_end,
-                    'date_precision': precision,
-                    'doc': provenance.get('doc'),
-                    'page': provenance.get('page'),
-                    'quote': provenance.get('quote'),
-                    'evidence_type': provenance.get('evidence_type'),
-                    'confidence': provenance.get('confidence')
-                }
-            })
-
-        return occupations, org_ids
-
-    def _parse_names(self, names_data: List[Dict], entity_id: str) -> List[Dict]:
-        """Parse names"""
-        names = []
-
-        for name in names_data:
-            interval = name.get('interval', '')
-            date_start, date_end, precision = EDTFParser.parse(interval)
-
-            parts = name.get('parts', {}) or {}
-            provenance = name.get('provenance', {}) or {}
-
-            names.append({
-                'rid': name.get('rid'),
-                'properties': {
-                    'display': name.get('display'),
-                    'parts_family': parts.get('family'),
-                    'parts_given': parts.get('given'),
-                    'parts_particle': parts.get('particle'),
-                    'lang': name.get('lang'),
-                    'interval': interval,
-                    'date_start': date_start,
-                    'date_end': date_end,
-                    'date_precision': precision,
-                    'type': name.get('type'),
-                    'doc': provenance.get('doc'),
-                    'quote': provenance.get('quote'),
-                    'evidence_type': provenance.get('evidence_type'),
-                    'confidence': provenance.get('confidence')
-                }
-            })
-
-        return names
-
-    def _parse_origins(self, origins_data: List[Dict], warnings: WikilinkWarnings, file_path: str) -> List[Dict]:
-        """Parse origins"""
-        origins = []
-
-        for origin in origins_data:
-            place_raw = origin.get('place')
-            place_id = None
-            if place_raw:
-                try:
-                    place_id = WikilinkExtractor.clean_id(place_raw, warnings, file_path)
-                except (ValueError, TypeError):
-                    pass
-
-            interval = origin.get('interval', '')
-            date_start, date_end, precision = EDTFParser.parse(interval)
-
-            provenance = origin.get('provenance', {}) or {}
-
-            origins.append({
-                'rid': origin.get('rid'),
-                'properties': {
-                    'mode': origin.get('mode'),
-                    'place': place_id,
-                    'interval': interval,
-                    'date_start': date_start,
-                    'date_end': date_end,
-                    'date_precision': precision,
-                    'is_primary': origin.get('is_primary', False),
-                    'doc': provenance.get('doc'),
-                    'quote': provenance.get('quote'),
-                    'evidence_type': provenance.get('evidence_type'),
-                    'confidence': provenance.get('confidence')
-                }
-            })
-
-        return origins
-
-    def _parse_family_relations(self, rels_data: List[Dict], warnings: WikilinkWarnings, file_path: str) -> Tuple[
-        List[Dict], Set[str]]:
-        """Parse family relations"""
-        relations = []
-        target_ids = set()
-
-        for rel in rels_data:
-            target_raw = rel.get('target')
-            target_id = None
-            if target_raw:
-                try:
-                    target_id = WikilinkExtractor.clean_id(target_raw, warnings, file_path)
-                    target_ids.add(target_id)
-                except (ValueError, TypeError):
-                    pass
+    def _clean_id(self, raw: Any, warnings: WikilinkWarnings, file_path: str) -> str:
+        """
+        WikilinkExtractor.clean_id mémoïsé pour le fichier en cours
+        (même organisation entre occupations, même cible entre relations).
+        Seuls les liens déjà préfixés par '/' et valides sont mis en cache :
+        corrections de slash et liens invalides restent journalisés à chaque occurrence.
+        """
+        cached = self._clean_cache.get(raw) if isinstance(raw, str) else None
+        if cached is not None:
+            return cached
 
-            interval = rel.get('interval', '')
-            date_start, date_end, precision = EDTFParser.parse(interval)
+        cleaned = WikilinkExtractor.clean_id(raw, warnings, file_path)
+        if isinstance(raw, str) and raw.strip('[]').startswith('/'):
+            self._clean_cache[raw] = cleaned
+        return cleaned
 
-            provenance = rel.get('provenance', {}) or {}
-
-            relations.append({
-                'rid': rel.get('rid'),
-                'target_id': target_id,
-                'properties': {
-                    'relation_type': rel.get('relation_type'),
-                    'interval': interval,
-                    'date_start': date_start,
-                    'date_end': date_end,
-                    'date_precision': precision,
-                    'doc': provenance.get('doc'),
-                    'quote': provenance.get('quote'),
-                    'evidence_type': provenance.get('evidence_type'),
-                    'confidence': provenance.get('confidence')
-                }
-            })
-
-        return relations, target_ids
-
-    def _parse_professional_relations(self, rels_data: List[Dict], warnings: WikilinkWarnings, file_path: str) -> Tuple[
-        List[Dict], Set[str]]:
-        """Parse professional relations"""
-        relations = []
-        target_ids = set()
-
-        for rel in rels_data:
-            target_raw = rel.get('target')
-            target_id = None
-            if target_raw:
-                try:
-                    target_id = WikilinkExtractor.clean_id(target_raw, warnings, file_path)
-                    target_ids.add(target_id)
-                except (ValueError, TypeError):
-                    pass
-
-            org_raw = rel.get('organization_context')
-            org_id = None
-            if org_raw:
-                try:
-                    org_id = WikilinkExtractor.clean_id(org_raw, warnings, file_path)
-                except (ValueError, TypeError):
-                    pass
+    def _parse_structure_list(self, struct_key: str, data: List[Dict], warnings: WikilinkWarnings,
+                              file_path: str) -> Tuple[List[StructureItem], Set[str]]:
+        """
+        Parse une liste de structures du frontmatter selon FRONTMATTER_STRUCTURES
 
-            interval = rel.get('interval', '')
+        Returns:
+            (items parsés, IDs liés collectés pour les relations spécifiques)
+        """
+        spec = self.FRONTMATTER_STRUCTURES[struct_key]
+        target_key = spec.get('target')
+        link_keys = spec.get('links', ())
+        part_keys = spec.get('parts', ())
+        collect_key = spec.get('collect')
+
+        items = []
+        linked_ids = set()
+
+        for entry in data:
+            resolved = {}
+            for key in ((target_key,) if target_key else ()) + link_keys:
+                raw = entry.get(key)
+                resolved[key] = None
+                if raw:
+                    try:
+                        resolved[key] = self._clean_id(raw, warnings, file_path)
+                    except (ValueError, TypeError):
+                        pass
+
+            if collect_key and resolved[collect_key]:
+                linked_ids.add(resolved[collect_key])
+
+            interval = entry.get('interval', '')
             date_start, date_end, precision = EDTFParser.parse(interval)
 
-            provenance = rel.get('provenance', {}) or {}
-
-            relations.append({
-                'rid': rel.get('rid'),
-                'target_id': target_id,
-                'properties': {
-                    'relation_type': rel.get('relation_type'),
-                    'organization_context': org_id,
-                    'interval': interval,
-                    'date_start': date_start,
-                    'date_end': date_end,
-                    'date_precision': precision,
-                    'doc': provenance.get('doc'),
-                    'quote': provenance.get('quote'),
-                    'evidence_type': provenance.get('evidence_type'),
-                    'confidence': provenance.get('confidence')
-                }
-            })
-
-        return relations, target_ids
\ No newline at end of file
+            provenance = entry.get('provenance', {}) or {}
+
+            properties = {key: entry.get(key) for key in spec['fields']}
+            for key, default in spec.get('defaults', {}).items():
+                properties[key] = entry.get(key, default)
+            for key in link_keys:
+                properties[key] = resolved[key]
+            if part_keys:
+                parts = entry.get('parts', {}) or {}
+                for key in part_keys:
+                    properties[f'parts_{key}'] = parts.get(key)
+            properties['interval'] = interval
+            properties['date_start'] = date_start
+            properties['date_end'] = date_end
+            properties['date_precision'] = precision
+            for key in spec['provenance']:
+                properties[key] = provenance.get(key)
+
+            items.append(StructureItem(
+                rid=entry.get('rid'),
+                properties=properties,
+                target_id=resolved[target_key] if target_key else None
+            ))
+
+        return items, linked_ids
+
+
+def _parse_entity_worker(vault_path: Path, file_path: Path, label: str):
+    """
+    Parsing d'un fichier entité, exécutable dans un process worker.
+    Retourne (entité ou None, warnings du fichier, erreur).
+    """
+    parser = EntityParser(vault_path, {})
+    warnings = WikilinkWarnings()
+
+    try:
+        return parser._parse_entity_file(file_path, warnings, label), warnings, None
+    except Exception as e:
+        return None, warnings, f"{type(e).__name__}: {str(e)}"
@@ -2,12 +2,18 @@
 """
 Parser pour structures réifiées depuis corps markdown
 Complète entity_parser.py existant
-✨ FIX v2.4.1 : Extraction robuste wikilinks + debug logging
+✨ FIX v2.4.1 : Extraction robuste wikilinks + debug logging (logger, niveau DEBUG)
 """
 
+import logging
 import re
 from typing import Dict, List, Optional, Tuple
 from .wikilink_extractor import WikilinkExtractor, WikilinkWarnings
+from .records import StructureItem
+
+# Traces détaillées de l'extraction des wikilinks (une ligne par propriété) :
+# visibles via logging.getLogger('utils.entity_parser_markdown').setLevel(logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 
 class MarkdownStructureParser:
@@ -31,29 +37,46 @@ class MarkdownStructureParser:
         }
     }
 
+    # Par label : (titre de section précompilé, clé de structure), construit une fois à l'import
+    LABEL_SECTIONS = {
+        label: tuple(
+            (re.compile(rf'^{re.escape(title)}\s*$', re.MULTILINE), struct_key)
+            for title, (struct_key, _) in sections.items()
+        )
+        for label, sections in SECTION_MAPPING.items()
+    }
+
+    # Patterns compilés une fois (le cache interne de re est partagé avec tout le process)
+    NEXT_SECTION_RE = re.compile(r'\n##(?!#)')
+    ITEM_LEVEL3_RE = re.compile(r'\n###\s+(.+?)(?=\n###|\Z)', re.DOTALL)
+    PROVENANCE_PROP_RE = re.compile(r'^\s*-\s*(.+?)\s*:\s*(.+)$')
+    PROPERTY_RE = re.compile(r'^-\s*\*\*(.+?)\*\*\s*:\s*(.+)$')
+    PARTS_RE = re.compile(r'-\s*(\w+)\s*:\s*(.+)')
+    WIKILINK_ID_RE = re.compile(r'\[\[(/id/\w+/[a-zA-Z0-9_-]+)(?:\|[^\]]+)?\]\]')
+    DOC_LINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]')
+
     def __init__(self, label: str, body: str, warnings: WikilinkWarnings, file_path: str):
         self.label = label
         self.body = body
         self.warnings = warnings
         self.file_path = file_path
-        self.sections_config = self.SECTION_MAPPING.get(label, {})
+        self.sections = self.LABEL_SECTIONS.get(label, ())
 
-    def parse_all_structures(self) -> Dict[str, List[Dict]]:
+    def parse_all_structures(self) -> Dict[str, List[StructureItem]]:
         """Parse toutes les structures depuis le corps markdown"""
         structures = {}
 
-        for section_title, (struct_key, rid_type) in self.sections_config.items():
-            items = self._parse_section(section_title)
+        for title_re, struct_key in self.sections:
+            items = self._parse_section(title_re)
             if items:
                 structures[struct_key] = items
 
         return structures
 
-    def _parse_section(self, section_title: str) -> List[Dict]:
-        """Parse une section niveau 2 (ex: ## Appellations)"""
+    def _parse_section(self, title_re: re.Pattern) -> List[StructureItem]:
+        """Parse une section niveau 2 (ex: ## Appellations), titre précompilé"""
         # Trouver la section
-        pattern = rf'^{re.escape(section_title)}\s*$'
-        match = re.search(pattern, self.body, re.MULTILINE)
+        match = title_re.search(self.body)
 
         if not match:
             return []
@@ -61,25 +84,20 @@ class MarkdownStructureParser:
         start_pos = match.end()
 
         # Trouver fin de section (prochaine section ## ou fin de fichier)
-        next_section = re.search(r'\n##(?!#)', self.body[start_pos:])
-        end_pos = start_pos + next_section.start() if next_section else len(self.body)
+        next_section = self.NEXT_SECTION_RE.search(self.body, start_pos)
+        end_pos = next_section.start() if next_section else len(self.body)
 
         section_content = self.body[start_pos:end_pos]
 
         # Extraire tous les items niveau 3
         return self._parse_items_level3(section_content)
 
-    def _parse_items_level3(self, section_content: str) -> List[Dict]:
+    def _parse_items_level3(self, section_content: str) -> List[StructureItem]:
         """Parse tous les items ### dans une section"""
         items = []
 
-        # Split par ### (items niveau 3)
-        item_pattern = r'\n###\s+(.+?)(?=\n###|\Z)'
-
-        for match in re.finditer(item_pattern, section_content, re.DOTALL):
-            item_title = match.group(1).split('\n')[0].strip()
-            item_content = match.group(1)
-
+        # Split par ### (items niveau 3) : seul le contenu de l'item est utile
+        for item_content in self.ITEM_LEVEL3_RE.findall(section_content):
             item_data = self._parse_item_properties(item_content)
 
             if item_data and 'rid' in item_data.get('properties', {}):
@@ -87,7 +105,7 @@ class MarkdownStructureParser:
 
         return items
 
-    def _parse_item_properties(self, item_content: str) -> Optional[Dict]:
+    def _parse_item_properties(self, item_content: str) -> Optional[StructureItem]:
         """Parse les propriétés d'un item (liste markdown)"""
         properties = {}
         provenance = {}
@@ -98,8 +116,9 @@ class MarkdownStructureParser:
         for line in lines:
             line = line.strip()
 
-            # Skip lignes vides et titre
-            if not line or line.startswith('###'):
+            # Dispatch sur le premier caractère : lignes vides, titre ### et texte
+            # libre ne commencent pas par '-' et ne peuvent matcher aucune regex
+            if not line or line[0] != '-':
                 continue
 
             # Détecter début bloc Provenance
@@ -114,7 +133,7 @@ class MarkdownStructureParser:
                     in_provenance = False
                 elif line.startswith('  - '):
                     # Sous-propriété provenance
-                    prov_match = re.match(r'^\s*-\s*(.+?)\s*:\s*(.+)$', line)
+                    prov_match = self.PROVENANCE_PROP_RE.match(line)
                     if prov_match:
                         key = prov_match.group(1).lower().replace(' ', '_')
                         value = prov_match.group(2).strip()
@@ -132,7 +151,7 @@ class MarkdownStructureParser:
                 continue
 
             # Propriétés principales
-            prop_match = re.match(r'^-\s*\*\*(.+?)\*\*\s*:\s*(.+)$', line)
+            prop_match = self.PROPERTY_RE.match(line)
             if prop_match:
                 key = prop_match.group(1).strip()
                 value = prop_match.group(2).strip()
@@ -155,10 +174,7 @@ class MarkdownStructureParser:
         # Extraire RID pour identifiant
         rid = properties.get('rid')
 
-        return {
-            'rid': rid,
-            'properties': properties
-        }
+        return StructureItem(rid=rid, properties=properties)
 
     def _normalize_property_key(self, key: str) -> Optional[str]:
         """Normalise les clés markdown vers clés attendues par le code"""
@@ -208,16 +224,8 @@ class MarkdownStructureParser:
 
     def _parse_parts(self, parts_text: str) -> Dict[str, Optional[str]]:
         """Parse le bloc Parts (indentation markdown)"""
-        parts = {}
-
-        # Pattern: - family : Nom
-        for match in re.finditer(r'-\s*(\w+)\s*:\s*(.+)', parts_text):
-            part_key = match.group(1).strip()
-            part_value = match.group(2).strip()
-
-            parts[part_key] = part_value if part_value else None
-
-        return parts
+        # Pattern: - family : Nom (clé \w+ : déjà sans espaces)
+        return {key: (value.strip() or None) for key, value in self.PARTS_RE.findall(parts_text)}
 
     def _extract_wikilink_id(self, text: str) -> Optional[str]:
         """
@@ -229,30 +237,18 @@ class MarkdownStructureParser:
         - UUIDs v4 : /id/person/d69babce-b1c2-4f46-ae27-5655ad9d6027
         - Slugs textuels : /id/gpe/geneve, /id/gpe/cossonay-vd
         """
-        # ✨ DEBUG : Log le texte brut
-        print(f"       🔍 Extracting from: '{text}'")
+        # UUID v4 (36 caractères hex) ⊂ slug [a-zA-Z0-9_-] : un seul pattern couvre les deux
+        match = self.WIKILINK_ID_RE.search(text)
+        extracted_id = match.group(1) if match else None
 
-        # ✨ Pattern strict : UUIDs v4 (36 caractères hex)
-        match = re.search(r'\[\[(/id/\w+/[a-fA-F0-9-]{36})(?:\|[^\]]+)?\]\]', text)
-        if match:
-            extracted_id = match.group(1)
-            print(f"       ✅ Extracted (UUID v4): {extracted_id}")
-            return extracted_id
-
-        # ✨ Pattern fallback : Slugs textuels (lettres + tirets + chiffres)
-        # Accepte : geneve, cossonay-vd, bale-ville, etc.
-        match_slug = re.search(r'\[\[(/id/\w+/[a-zA-Z0-9_-]+)(?:\|[^\]]+)?\]\]', text)
-        if match_slug:
-            extracted_id = match_slug.group(1)
-            print(f"       ✅ Extracted (slug): {extracted_id}")
-            return extracted_id
-
-        print(f"       ❌ No match found!")
-        return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Extracting from: %r → %s", text, extracted_id or '❌ No match found!')
+
+        return extracted_id
 
     def _extract_doc_link(self, text: str) -> Optional[str]:
         """Extrait nom document depuis [[nom-doc]]"""
-        match = re.search(r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]', text)
+        match = self.DOC_LINK_RE.search(text)
         if match:
             return match.group(1)
         return None
@@ -260,7 +256,7 @@ class MarkdownStructureParser:
 
 def parse_structures_from_markdown(label: str, body: str,
                                    warnings: WikilinkWarnings,
-                                   file_path: str) -> Dict[str, List[Dict]]:
+                                   file_path: str) -> Dict[str, List[StructureItem]]:
     """
     Fonction utilitaire pour parser structures depuis markdown
 
@@ -273,5 +269,9 @@ def parse_structures_from_markdown(label: str, body: str,
     Returns:
         Dict de structures parsées, format compatible avec entity_parser.py
     """
+    # Label sans section markdown (ex: Entity) : rien à parser
+    if label not in MarkdownStructureParser.LABEL_SECTIONS:
+        return {}
+
     parser = MarkdownStructureParser(label, body, warnings, file_path)
     return parser.parse_all_structures()
\ No newline at end of file
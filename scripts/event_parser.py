@@ -4,79 +4,119 @@ Parser pour événements depuis documents
 """
 
 import re
+import sys
 import hashlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import List, Iterator, Optional, Tuple
 from .wikilink_extractor import WikilinkExtractor, WikilinkWarnings
 from .edtf_parser import EDTFParser
+from .document_ids import document_base_id
+from .vault_scan import VaultIndex, markdown_files, folder_prefixes
+from .parallel import map_jobs
+from .records import EventAssertion, ParsedEvent
+
+
+@lru_cache(maxsize=8192)
+def _id_digest(s: str) -> str:
+    """BLAKE2b-128 hexadécimal mémoïsé (empreinte non cryptographique, comme les doc_id)"""
+    return hashlib.blake2b(s.encode('utf-8'), digest_size=16).hexdigest()
 
 
 class EventParser:
     """Parse les événements depuis documents Obsidian"""
 
-    EVENT_BLOCK_RE = re.compile(
-        r'(?m)^#event_id:\s*(.+?)\s*$([\s\S]*?)(?=^#(?:event_id|micro_id):|^---|\Z)',
-        re.MULTILINE
-    )
+    # Bloc = en-tête #event_id: … jusqu'au prochain #event_id:/#micro_id:, '---' ou fin de texte.
+    # Fin de bloc cherchée par un search() ancré au lieu d'un lookahead testé caractère par caractère
+    EVENT_HEADER_RE = re.compile(r'^#event_id:\s*(.+?)\s*$', re.MULTILINE)
+    BLOCK_END_RE = re.compile(r'^(?:#(?:event_id|micro_id):|---)', re.MULTILINE)
     KV_RE = re.compile(r'^\s*-\s*([A-Za-z0-9_]+)\s*:\s*(.+?)\s*$')
-    DESC_PATTERN = re.compile(r'^\*\*\s*Description\s*:?\s*$', re.IGNORECASE)
-    OBS_PATTERN = re.compile(r'^\*\*\s*Observations?\s*:?\s*$', re.IGNORECASE)
+    # **Description** / **Observation(s)** : un seul match, dispatch sur le groupe
+    SECTION_HEADER_RE = re.compile(r'^\*\*\s*(Description|Observations?)\s*:?\s*$', re.IGNORECASE)
+
+    # Valeurs à faible cardinalité, partagées entre événements via sys.intern
+    INTERNED_KEYS = frozenset({
+        'event_type', 'date_source', 'agent_precision', 'agent_role',
+        'place_precision', 'confidence', 'evidence_type', 'tags'
+    })
 
-    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None):
+    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None,
+                 workers: Optional[int] = None, vault_index: Optional[VaultIndex] = None):
         self.vault_path = vault_path
         self.config = config
         self.folders = folders
+        self._folder_prefixes = folder_prefixes(folders)
+        self.workers = workers
+        self.vault_index = vault_index
 
     def _should_process_file(self, file_path: Path) -> bool:
         """Vérifie si le fichier doit être parsé selon les dossiers sélectionnés"""
-        if not self.folders:
-            return True
+        return not self._folder_prefixes or str(file_path).startswith(self._folder_prefixes)
 
-        return any(file_path.is_relative_to(folder) for folder in self.folders)
-
-    def parse_all(self) -> Tuple[List[Dict[str, Any]], WikilinkWarnings]:
+    def parse_all(self) -> Tuple[List[ParsedEvent], WikilinkWarnings]:
         """Parse tous les événements"""
         events = []
         warnings = WikilinkWarnings()
 
-        for file_path in self.vault_path.rglob("*.md"):
-            if not self._should_process_file(file_path):
-                continue
+        jobs = [
+            (self.vault_path, file_path)
+            for file_path in markdown_files(self.vault_path, self.vault_index)
+            if self._should_process_file(file_path)
+        ]
+
+        results = map_jobs(_parse_events_worker, jobs, self.workers)
 
-            try:
-                doc_events = self._parse_events_from_file(file_path, warnings)
-                events.extend(doc_events)
-            except Exception as e:
-                warnings.log_parse_error(str(file_path), f"{type(e).__name__}: {str(e)}")
+        for (_, file_path), (doc_events, file_warnings, error) in zip(jobs, results):
+            warnings.merge(file_warnings)
+            events.extend(doc_events)
+            if error:
+                warnings.log_parse_error(str(file_path), error)
 
         return events, warnings
 
-    def _parse_events_from_file(self, file_path: Path, warnings: WikilinkWarnings) -> List[Dict[str, Any]]:
+    def _parse_events_from_file(self, file_path: Path, warnings: WikilinkWarnings) -> List[ParsedEvent]:
         """Parse événements depuis un fichier"""
-        text = file_path.read_text(encoding='utf-8')
+        text = file_path.read_bytes().decode('utf-8')
+        if '\r' in text:
+            # Mêmes fins de ligne que read_text() (newlines universels)
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        # La plupart des notes n'ont aucun événement : test littéral avant toute regex
+        if '#event_id:' not in text:
+            return []
 
         doc_id = self._build_document_id_from_path(file_path)
 
         events = []
 
-        for match in self.EVENT_BLOCK_RE.finditer(text):
-            raw_id = match.group(1).strip()
-            block_content = match.group(2)
-
+        for raw_id, block_content in self._iter_event_blocks(text):
             event = self._parse_event_block(raw_id, block_content, doc_id, str(file_path), warnings)
             if event:
                 events.append(event)
 
         return events
 
+    def _iter_event_blocks(self, text: str) -> Iterator[Tuple[str, str]]:
+        """Génère (raw_id, contenu) pour chaque bloc événement du texte"""
+        pos = 0
+        while True:
+            header = self.EVENT_HEADER_RE.search(text, pos)
+            if not header:
+                return
+
+            end = self.BLOCK_END_RE.search(text, header.end())
+            pos = end.start() if end else len(text)
+
+            yield header.group(1).strip(), text[header.end():pos]
+
     def _parse_event_block(self, raw_id: str, content: str, doc_id: str,
-                           file_path: str, warnings: WikilinkWarnings) -> Optional[Dict[str, Any]]:
+                           file_path: str, warnings: WikilinkWarnings) -> Optional[ParsedEvent]:
         """Parse un bloc événement"""
         event_id = self._canonicalize_event_id(raw_id)
 
         data = {'id': raw_id}
-        description_text = ""
-        observation_text = ""
+        description_lines = []
+        observation_lines = []
         in_description = False
         in_observation = False
 
@@ -84,25 +124,26 @@ class EventParser:
 
         for line in content.splitlines():
             line_stripped = line.strip()
-
-            if self.DESC_PATTERN.match(line_stripped):
-                in_description = True
-                in_observation = False
-                continue
-            elif self.OBS_PATTERN.match(line_stripped):
-                in_observation = True
+            is_bold = line_stripped.startswith("**")
+
+            if is_bold:
+                header = self.SECTION_HEADER_RE.match(line_stripped)
+                if header:
+                    in_description = header.group(1).lower() == 'description'
+                    in_observation = not in_description
+                    continue
                 in_description = False
-                continue
-            elif line_stripped.startswith("**") or line_stripped.startswith("---"):
+                in_observation = False
+            elif line_stripped.startswith("---"):
                 in_description = False
                 in_observation = False
 
             if in_description:
-                description_text += line + "\n"
+                description_lines.append(line)
             elif in_observation:
-                observation_text += line + "\n"
+                observation_lines.append(line)
 
-            if not line_stripped or line_stripped.startswith("**"):
+            if is_bold or not line_stripped:
                 continue
 
             kv = self.KV_RE.match(line)
@@ -114,13 +155,17 @@ class EventParser:
                     if entity_id:
                         data[f"{key}_id"] = entity_id
                         specific_entities.add(entity_id)
+                elif key in self.INTERNED_KEYS:
+                    data[key] = sys.intern(val)
                 else:
                     data[key] = val
 
-        if description_text.strip():
-            data['description'] = description_text.strip()
-        if observation_text.strip():
-            data['observation'] = observation_text.strip()
+        description_text = "\n".join(description_lines).strip()
+        if description_text:
+            data['description'] = description_text
+        observation_text = "\n".join(observation_lines).strip()
+        if observation_text:
+            data['observation'] = observation_text
 
         # Extraire wikilinks
         all_links = set()
@@ -170,24 +215,24 @@ class EventParser:
             'unknown_agent': unknown_agent
         }
 
-        assertion = {
-            'assertion_id': f"{event_id}::assertion",
-            'doc_id': doc_id,
-            'properties': {
+        assertion = EventAssertion(
+            assertion_id=f"{event_id}::assertion",
+            doc_id=doc_id,
+            properties={
                 'type': 'EVENT_ASSERTION',
                 'confidence': data.get('confidence', 'medium'),
                 'evidence_type': data.get('evidence_type', 'reported'),
                 'source_quote': data.get('source_quote', ''),
                 'page': data.get('page')
             }
-        }
+        )
 
-        return {
-            'event_id': event_id,
-            'properties': properties,
-            'assertion': assertion,
-            'references': generic_refs
-        }
+        return ParsedEvent(
+            event_id=event_id,
+            properties=properties,
+            assertion=assertion,
+            references=generic_refs
+        )
 
     def _extract_entity_id(self, wikilink: str, warnings: WikilinkWarnings,
                            file_path: str, line_num: int) -> Optional[str]:
@@ -206,10 +251,22 @@ class EventParser:
         """Canonicalise event_id"""
         if raw_id.startswith('/id/event/'):
             return raw_id
-        return f"/id/event/{hashlib.sha1(raw_id.encode('utf-8')).hexdigest()}"
+        return f"/id/event/{_id_digest(raw_id)}"
 
     def _build_document_id_from_path(self, file_path: Path) -> str:
         """Génère doc_id depuis nom fichier (cohérent avec document_parser)"""
-        file_name = file_path.name
-        h = hashlib.sha1(file_name.encode('utf-8')).hexdigest()
-        return f"/id/document/{h}"
\ No newline at end of file
+        return document_base_id(file_path)
+
+
+def _parse_events_worker(vault_path: Path, file_path: Path):
+    """
+    Parsing des événements d'un fichier, exécutable dans un process worker.
+    Retourne (événements, warnings du fichier, erreur).
+    """
+    parser = EventParser(vault_path, {})
+    warnings = WikilinkWarnings()
+
+    try:
+        return parser._parse_events_from_file(file_path, warnings), warnings, None
+    except Exception as e:
+        return [], warnings, f"{type(e).__name__}: {str(e)}"
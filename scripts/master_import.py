@@ -19,10 +19,18 @@ import os
 import sys
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 import json
 
+# orjson (C, plus rapide) si disponible, sinon json standard
+try:
+    import orjson as _json_backend
+except ImportError:
+    _json_backend = json
+
 from neo4j import GraphDatabase
 from neo4j.exceptions import ServiceUnavailable, AuthError
 
@@ -59,9 +67,9 @@ class Config:
             sys.exit(1)
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            with open(config_path, 'rb') as f:
+                data = _json_backend.loads(f.read())
+        except ValueError as e:  # json/orjson.JSONDecodeError (et UTF-8 invalide)
             print(f"❌ Erreur parsing config.json : {e}")
             sys.exit(1)
 
@@ -91,10 +99,94 @@ class Config:
         )
 
 
+@dataclass(slots=True)
+class ImportStats:
+    """Compteurs d'import (attributs à slots : incréments sans accès dict)"""
+    entities: int = 0
+    documents: int = 0
+    events: int = 0
+    microactions: int = 0
+    relations_performed: int = 0
+    relations_received: int = 0
+    relations_concerns: int = 0
+    relations_contains: int = 0
+    relations_participated: int = 0
+    relations_located_in: int = 0
+    relations_is_part_of: int = 0
+    relations_worked_for: int = 0
+    relations_references: int = 0
+
+
 # ============================================================================
 # EDTF DATE PARSER (FIX v2.3.1)
 # ============================================================================
 
+# Précision d'un intervalle selon (date_start is None, date_end is None)
+_INTERVAL_PRECISION = (
+    'interval',    # "1942-03-29/1942-04-27"
+    'open_end',    # "1942-03-29/.."
+    'open_start',  # "../1942-05-05"
+    'unknown',     # "../.."
+)
+
+
+def _clean_edtf_bound(raw: str) -> Optional[str]:
+    """Borne d'intervalle EDTF : '' ou '..' → None, marqueurs ~/? retirés"""
+    raw = raw.strip()
+    if not raw or raw == '..':
+        return None
+    if '~' in raw or '?' in raw:
+        raw = raw.replace('~', '').replace('?', '').strip()
+        # Double-check après nettoyage
+        if raw == '..':
+            return None
+    return raw
+
+
+@lru_cache(maxsize=8192)
+def parse_edtf_tuple(edtf_string: str) -> Tuple[Optional[str], Optional[str], str]:
+    """
+    Variante sans dict de parse_edtf_date : (date_start, date_end, date_precision).
+
+    Scanner par find()/slices : aucune chaîne intermédiaire quand la date
+    n'a pas de marqueur ~/? (cas courant). Résultat (tuple immuable) mémoïsé :
+    les mêmes dates reviennent d'un événement à l'autre.
+    """
+    if not edtf_string:
+        return None, None, 'unknown'
+
+    edtf_string = edtf_string.strip()
+
+    # Cas 1 : Totalement inconnu
+    if not edtf_string or edtf_string == '..':
+        return None, None, 'unknown'
+
+    # Cas 2 : Intervalle (avec ou sans dates ouvertes)
+    sep = edtf_string.find('/')
+    if sep != -1:
+        # Seules les deux premières parties comptent (comme split('/')[:2])
+        stop = edtf_string.find('/', sep + 1)
+        date_start = _clean_edtf_bound(edtf_string[:sep])
+        date_end = _clean_edtf_bound(edtf_string[sep + 1:] if stop == -1 else edtf_string[sep + 1:stop])
+
+        # Déterminer la précision : index 2 bits (début absent, fin absente)
+        return date_start, date_end, _INTERVAL_PRECISION[((date_start is None) << 1) | (date_end is None)]
+
+    # Cas 3 : Date approximative (~), Cas 4 : Date incertaine (?)
+    for marker, precision in (('~', 'approximate'), ('?', 'uncertain')):
+        pos = edtf_string.find(marker)
+        if pos == -1:
+            continue
+        if pos == len(edtf_string) - 1:
+            clean_date = edtf_string[:-1].rstrip()  # marqueur final unique
+        else:
+            clean_date = edtf_string.replace(marker, '').strip()
+        return clean_date, clean_date, precision
+
+    # Cas 5 : Date exacte (YYYY-MM-DD)
+    return edtf_string, edtf_string, 'exact'
+
+
 def parse_edtf_date(edtf_string: str) -> Dict[str, Optional[str]]:
     """
     Parse EDTF string and return normalized dates.
@@ -121,123 +213,394 @@ def parse_edtf_date(edtf_string: str) -> Dict[str, Optional[str]]:
             'date_edtf': str (original)
         }
     """
-    if not edtf_string or edtf_string.strip() == '':
-        return {
-            'date_start': None,
-            'date_end': None,
-            'date_precision': 'unknown',
-            'date_edtf': edtf_string
+    date_start, date_end, precision = parse_edtf_tuple(edtf_string)
+    stripped = edtf_string.strip() if edtf_string else edtf_string
+    return {
+        'date_start': date_start,
+        'date_end': date_end,
+        'date_precision': precision,
+        'date_edtf': stripped or edtf_string
+    }
+
+
+def _enrich_dates(properties: Dict) -> Dict:
+    """
+    Copie des propriétés complétée par date_start/date_end/date_precision/gap_flag
+    (parse EDTF). Pré-passe CPU faite avant les écritures Neo4j.
+    """
+    props = properties.copy()  # Copie pour modification
+
+    # ✨ FIX v2.3.1 : Parser date_edtf pour créer date_start et date_end
+    if props.get('date_edtf'):
+        date_start, date_end, date_precision = parse_edtf_tuple(props['date_edtf'])
+        props['date_start'] = date_start
+        props['date_end'] = date_end
+        props['date_precision'] = date_precision
+
+        # Calculer gap_flag correctement
+        props['gap_flag'] = (date_start is None or
+                             date_end is None)
+    else:
+        # Pas de date EDTF
+        props['date_start'] = None
+        props['date_end'] = None
+        props['date_precision'] = 'unknown'
+        props['gap_flag'] = True
+
+    return props
+
+
+# ============================================================================
+# NEO4J CLIENT
+# ============================================================================
+
+class Neo4jClient:
+    """Client Neo4j avec support Aura"""
+
+    # Taille des lots UNWIND (une transaction par lot)
+    BATCH_SIZE = 1000
+
+    # Écritures concurrentes (nœuds entités, micro-actions) : une session par lot, les sessions ne sont pas thread-safe
+    WRITER_THREADS = 8
+
+    # Requêtes en Cypher pur, sans procédures APOC (apoc.merge.*, apoc.periodic.iterate...) :
+    # l'import ne dépend d'aucun plugin à installer sur les serveurs auto-hébergés.
+    # Labels et types de relation non paramétrables → une requête constante par cas dans les tables ci-dessous.
+
+    # MERGE des nœuds entités, une requête constante par label (le label ne peut pas être paramétré) :
+    # même texte Cypher d'un lot à l'autre, donc plan mis en cache côté serveur
+    ENTITY_NODE_QUERIES = {
+        'GPE': """
+            UNWIND $rows AS row
+            MERGE (e:GPE {id: row.id})
+            SET e += row.properties
+        """,
+        'Organization': """
+            UNWIND $rows AS row
+            MERGE (e:Organization {id: row.id})
+            SET e += row.properties
+        """,
+        'Person': """
+            UNWIND $rows AS row
+            MERGE (e:Person {id: row.id})
+            SET e += row.properties
+        """,
+    }
+
+    # Relations spécifiques des entités : type → (requête UNWIND, compteur stats)
+    SPECIFIC_RELATION_QUERIES = {
+        'LOCATED_IN': ("""
+            UNWIND $rows AS row
+            MATCH (e {id: row.source})
+            MATCH (g:GPE {id: row.target})
+            MERGE (e)-[:LOCATED_IN]->(g)
+        """, 'relations_located_in'),
+        'IS_PART_OF': ("""
+            UNWIND $rows AS row
+            MATCH (child {id: row.source})
+            MATCH (parent:Organization {id: row.target})
+            MERGE (child)-[:IS_PART_OF]->(parent)
+        """, 'relations_is_part_of'),
+        'WORKED_FOR': ("""
+            UNWIND $rows AS row
+            MATCH (p:Person {id: row.source})
+            MATCH (o:Organization {id: row.target})
+            MERGE (p)-[:WORKED_FOR]->(o)
+        """, 'relations_worked_for'),
+    }
+
+    ENTITY_REFERENCES_QUERY = """
+        UNWIND $rows AS row
+        MATCH (e {id: row.source})
+        MATCH (target {id: row.target})
+        MERGE (e)-[:REFERENCES]->(target)
+    """
+
+    DOCUMENT_NODE_QUERY = """
+        UNWIND $rows AS row
+        MERGE (d:ArchiveDocument {id: row.id})
+        SET d += row.properties
+    """
+
+    DOCUMENT_REFERENCES_QUERY = """
+        UNWIND $rows AS row
+        MATCH (d:ArchiveDocument {id: row.source})
+        MATCH (target {id: row.target})
+        MERGE (d)-[:REFERENCES]->(target)
+    """
+
+    # Passe 1 : nœuds de structures réifiées par type (SANS relations vers d'autres entités)
+    STRUCTURE_NODE_QUERIES = {
+        'occupations': """
+            UNWIND $rows AS row
+            MATCH (p:Person {id: row.entity_id})
+            CREATE (o:Occupation)
+            SET o = row.properties, o.rid = row.rid
+            MERGE (p)-[:HAS_OCCUPATION]->(o)
+        """,
+        'names': """
+            UNWIND $rows AS row
+            MATCH (p:Person {id: row.entity_id})
+            CREATE (n:Name)
+            SET n = row.properties, n.rid = row.rid
+            MERGE (p)-[:HAS_NAME]->(n)
+        """,
+        'origins': """
+            UNWIND $rows AS row
+            MATCH (p:Person {id: row.entity_id})
+            CREATE (o:Origin)
+            SET o = row.properties, o.rid = row.rid
+            MERGE (p)-[:HAS_ORIGIN]->(o)
+        """,
+        'family_relations': """
+            UNWIND $rows AS row
+            MATCH (p:Person {id: row.entity_id})
+            CREATE (fr:FamilyRelation)
+            SET fr = row.properties, fr.rid = row.rid
+            MERGE (p)-[:HAS_FAMILY_REL]->(fr)
+        """,
+        'professional_relations': """
+            UNWIND $rows AS row
+            MATCH (p:Person {id: row.entity_id})
+            CREATE (pr:ProfessionalRelation)
+            SET pr = row.properties, pr.rid = row.rid
+            MERGE (p)-[:HAS_PROF_REL]->(pr)
+        """,
+        'residences': """
+            UNWIND $rows AS row
+            MATCH (p:Person {id: row.entity_id})
+            CREATE (r:Residence)
+            SET r = row.properties, r.rid = row.rid
+            MERGE (p)-[:HAS_RESIDENCE]->(r)
+        """,
+    }
+
+    # Passe 2 : relations structures → entités, par type : ((propriété cible, requête UNWIND), ...)
+    # ✨ FIX v2.3.2 : props 'target' (relations familiales/professionnelles) + residences
+    STRUCTURE_RELATION_QUERIES = {
+        'occupations': (
+            ('organization', """
+                UNWIND $rows AS row
+                MATCH (o:Occupation {rid: row.rid})
+                MATCH (org:Organization {id: row.target})
+                MERGE (o)-[:AT_ORGANIZATION]->(org)
+            """),
+            ('place', """
+                UNWIND $rows AS row
+                MATCH (o:Occupation {rid: row.rid})
+                MATCH (g:GPE {id: row.target})
+                MERGE (o)-[:AT_PLACE]->(g)
+            """),
+        ),
+        'origins': (
+            ('place', """
+                UNWIND $rows AS row
+                MATCH (o:Origin {rid: row.rid})
+                MATCH (g:GPE {id: row.target})
+                MERGE (o)-[:AT_PLACE]->(g)
+            """),
+        ),
+        'family_relations': (
+            ('target', """
+                UNWIND $rows AS row
+                MATCH (fr:FamilyRelation {rid: row.rid})
+                MATCH (target:Person {id: row.target})
+                MERGE (fr)-[:RELATES_TO]->(target)
+            """),
+        ),
+        'professional_relations': (
+            ('target', """
+                UNWIND $rows AS row
+                MATCH (pr:ProfessionalRelation {rid: row.rid})
+                MATCH (target {id: row.target})
+                MERGE (pr)-[:RELATES_TO]->(target)
+            """),
+            ('organization_context', """
+                UNWIND $rows AS row
+                MATCH (pr:ProfessionalRelation {rid: row.rid})
+                MATCH (org:Organization {id: row.target})
+                MERGE (pr)-[:IN_CONTEXT_OF]->(org)
+            """),
+        ),
+        'residences': (
+            ('place', """
+                UNWIND $rows AS row
+                MATCH (r:Residence {rid: row.rid})
+                MATCH (g:GPE {id: row.target})
+                MERGE (r)-[:AT_PLACE]->(g)
+            """),
+        ),
+    }
+
+    # Événement complet en une requête : nœud, assertion, victim/agent/place, REFERENCES.
+    # Mêmes sous-CALL isolés que pour les micro-actions (cible absente → relation ignorée, ligne conservée).
+    # Pas de FOREACH : il ne peut pas MATCH, et un MERGE y créerait des Person/GPE orphelines.
+    # Agent : id sous le champ de son label (_entity_labels) ; agent_other_id (tout label) sinon,
+    # gardé par IS NOT NULL : le MATCH sans label parcourt tous les nœuds, à ne lancer que pour ces rares lignes.
+    # Sous-requêtes CALL { WITH ... } (toutes versions 5.x, CALL (x) { } exige 5.23) ; le WITH d'import
+    # n'accepte pas de WHERE, d'où le second WITH pour la garde.
+    EVENT_IMPORT_QUERY = """
+        UNWIND $rows AS row
+        MERGE (e:Event {event_id: row.event_id})
+        SET e += row.properties
+
+        CALL {
+            WITH row, e
+            MATCH (d:ArchiveDocument {id: row.doc_id})
+            MERGE (a:Assertion {assertion_id: row.assertion_id})
+            SET a += row.assertion_properties
+            MERGE (d)-[:SUPPORTS]->(a)
+            MERGE (a)-[:CLAIMS]->(e)
         }
 
-    edtf_string = edtf_string.strip()
+        CALL {
+            WITH row, e
+            MATCH (v:Person {id: row.victim_id})
+            MERGE (v)-[:WAS_VICTIM_OF]->(e)
+        }
 
-    # Cas 1 : Totalement inconnu
-    if edtf_string == '..':
-        return {
-            'date_start': None,
-            'date_end': None,
-            'date_precision': 'unknown',
-            'date_edtf': edtf_string
+        CALL {
+            WITH row, e
+            MATCH (a:Person {id: row.agent_person_id})
+            MERGE (a)-[:ACTED_AS_AGENT]->(e)
         }
 
-    # Cas 2 : Intervalle (avec ou sans dates ouvertes)
-    if '/' in edtf_string:
-        parts = edtf_string.split('/')
+        CALL {
+            WITH row, e
+            MATCH (a:Organization {id: row.agent_org_id})
+            MERGE (a)-[:ACTED_AS_AGENT]->(e)
+        }
 
-        # Parser chaque partie (filtrer ".." et nettoyer)
-        date_start_raw = parts[0].strip()
-        date_end_raw = parts[1].strip() if len(parts) > 1 else ''
+        CALL {
+            WITH row, e
+            WITH row, e
+            WHERE row.agent_other_id IS NOT NULL
+            MATCH (a {id: row.agent_other_id})
+            MERGE (a)-[:ACTED_AS_AGENT]->(e)
+        }
 
-        # ✨ FIX v2.3.1 : Normalisation robuste date_start
-        if not date_start_raw or date_start_raw == '..' or date_start_raw == '':
-            date_start = None
-        else:
-            # Nettoyer marqueurs EDTF (~, ?)
-            date_start = date_start_raw.replace('~', '').replace('?', '').strip()
-            # Double-check après nettoyage
-            if date_start == '..':
-                date_start = None
-
-        # ✨ FIX v2.3.1 : Normalisation robuste date_end
-        if not date_end_raw or date_end_raw == '..' or date_end_raw == '':
-            date_end = None
-        else:
-            date_end = date_end_raw.replace('~', '').replace('?', '').strip()
-            # Double-check après nettoyage
-            if date_end == '..':
-                date_end = None
-
-        # Déterminer la précision
-        if date_start is None and date_end is not None:
-            precision = 'open_start'  # "../1942-05-05"
-        elif date_start is not None and date_end is None:
-            precision = 'open_end'  # "1942-03-29/.."
-        elif date_start is None and date_end is None:
-            precision = 'unknown'  # "../.."
-        else:
-            precision = 'interval'  # "1942-03-29/1942-04-27"
+        CALL {
+            WITH row, e
+            MATCH (p:GPE {id: row.place_id})
+            MERGE (e)-[:OCCURRED_AT]->(p)
+        }
 
-        return {
-            'date_start': date_start,
-            'date_end': date_end,
-            'date_precision': precision,
-            'date_edtf': edtf_string
+        CALL {
+            WITH row, e
+            UNWIND row.references AS ref_id
+            MATCH (target {id: ref_id})
+            MERGE (e)-[:REFERENCES]->(target)
         }
+    """
 
-    # Cas 3 : Date approximative (~)
-    if '~' in edtf_string:
-        clean_date = edtf_string.replace('~', '').strip()
-        return {
-            'date_start': clean_date,
-            'date_end': clean_date,
-            'date_precision': 'approximate',
-            'date_edtf': edtf_string
+    # Micro-actions en deux requêtes.
+    # 1) Nœuds (écrits en parallèle) : MicroAction, Assertion et CLAIMS ne touchent que des nœuds
+    #    propres à la micro-action ; le document est seulement lu (assertion créée s'il existe).
+    # 2) Relations (écrites en séquence, après la barrière) : SUPPORTS, PERFORMED/RECEIVED/CONCERNS
+    #    et REFERENCES se posent sur des nœuds partagés (documents, personnes, organisations) ;
+    #    des transactions concurrentes s'y disputeraient les verrous (DeadlockDetected).
+    # Chaque relation optionnelle est isolée dans un sous-CALL : une cible absente ne supprime pas la ligne.
+    # Acteur/destinataire : label connu côté Python (_entity_labels), la ligne ne porte l'id
+    # que sous le champ de son label → un seul MATCH indexé, sans filtre (a:Person OR a:Organization).
+    MICROACTION_NODE_QUERY = """
+        UNWIND $rows AS row
+        MERGE (m:MicroAction {micro_id: row.micro_id})
+        SET m += row.properties
+
+        CALL {
+            WITH row, m
+            MATCH (:ArchiveDocument {id: row.doc_id})
+            MERGE (a:Assertion {assertion_id: row.assertion_id})
+            SET a += row.assertion_properties
+            MERGE (a)-[:CLAIMS]->(m)
         }
+    """
 
-    # Cas 4 : Date incertaine (?)
-    if '?' in edtf_string:
-        clean_date = edtf_string.replace('?', '').strip()
-        return {
-            'date_start': clean_date,
-            'date_end': clean_date,
-            'date_precision': 'uncertain',
-            'date_edtf': edtf_string
+    MICROACTION_RELATION_QUERY = """
+        UNWIND $rows AS row
+        MATCH (m:MicroAction {micro_id: row.micro_id})
+
+        CALL {
+            WITH row, m
+            MATCH (d:ArchiveDocument {id: row.doc_id})
+            MATCH (a:Assertion)-[:CLAIMS]->(m)
+            WHERE a.assertion_id = row.assertion_id
+            MERGE (d)-[:SUPPORTS]->(a)
         }
 
-    # Cas 5 : Date exacte (YYYY-MM-DD)
-    return {
-        'date_start': edtf_string,
-        'date_end': edtf_string,
-        'date_precision': 'exact',
-        'date_edtf': edtf_string
-    }
+        CALL {
+            WITH row, m
+            MATCH (a:Person {id: row.actor_person_id})
+            MERGE (a)-[:PERFORMED]->(m)
+        }
 
+        CALL {
+            WITH row, m
+            MATCH (a:Organization {id: row.actor_org_id})
+            MERGE (a)-[:PERFORMED]->(m)
+        }
 
-# ============================================================================
-# NEO4J CLIENT
-# ============================================================================
+        CALL {
+            WITH row, m
+            MATCH (r:Person {id: row.recipient_person_id})
+            MERGE (m)-[:RECEIVED]->(r)
+        }
 
-class Neo4jClient:
-    """Client Neo4j avec support Aura"""
+        CALL {
+            WITH row, m
+            MATCH (r:Organization {id: row.recipient_org_id})
+            MERGE (m)-[:RECEIVED]->(r)
+        }
+
+        CALL {
+            WITH row, m
+            MATCH (p:Person {id: row.about_id})
+            MERGE (m)-[:CONCERNS]->(p)
+        }
+
+        CALL {
+            WITH row, m
+            UNWIND row.references AS ref_id
+            MATCH (target {id: ref_id})
+            MERGE (m)-[:REFERENCES]->(target)
+        }
+    """
+
+    # Schéma : (nom, label, propriété)
+    UNIQUE_CONSTRAINTS = (
+        ('entity_id', 'Person', 'id'),
+        ('org_id', 'Organization', 'id'),
+        ('gpe_id', 'GPE', 'id'),
+        ('doc_id', 'ArchiveDocument', 'id'),
+        ('event_id', 'Event', 'event_id'),
+        ('micro_id', 'MicroAction', 'micro_id'),
+    )
+
+    INDEXES = (
+        # Index pour performance (EXISTANTS)
+        ('person_name', 'Person', 'prefLabel_fr'),
+        ('org_name', 'Organization', 'prefLabel_fr'),
+        ('micro_date', 'MicroAction', 'date_start'),
+        ('event_date', 'Event', 'date_start'),
+
+        # NOUVEAUX INDEX (critiques pour relations calculées)
+        ('micro_actor', 'MicroAction', 'actor_id'),
+        ('micro_recipient', 'MicroAction', 'recipient_id'),
+        ('micro_about', 'MicroAction', 'about_id'),
+        ('event_victim', 'Event', 'victim_id'),
+        ('event_date_end', 'Event', 'date_end'),
+        ('person_id', 'Person', 'id'),
+        ('org_id_lookup', 'Organization', 'id'),
+    )
 
     def __init__(self, config: Config):
         self.config = config
         self.driver = None
-        self.stats = {
-            'entities': 0,
-            'documents': 0,
-            'events': 0,
-            'microactions': 0,
-            'relations_performed': 0,
-            'relations_received': 0,
-            'relations_concerns': 0,
-            'relations_contains': 0,
-            'relations_participated': 0,
-            'relations_located_in': 0,
-            'relations_is_part_of': 0,
-            'relations_worked_for': 0,
-            'relations_references': 0
-        }
+        # Session unique pour tout l'import (ouverte dans connect, fermée dans close)
+        self.session = None
+        # id → label des Person/Organization (voir _entity_labels)
+        self._entity_label_cache = None
+        self.stats = ImportStats()
 
     def connect(self):
         """Connexion à Neo4j"""
@@ -253,6 +616,7 @@ class Neo4jClient:
 
             # Test connexion
             self.driver.verify_connectivity()
+            self.session = self.driver.session(database=self.config.neo4j_database)
             print(f"✅ Connecté à Neo4j : {self.config.neo4j_uri}")
 
         except AuthError:
@@ -267,120 +631,137 @@ class Neo4jClient:
 
     def close(self):
         """Fermeture connexion"""
+        if self.session:
+            self.session.close()
+            self.session = None
         if self.driver:
             self.driver.close()
 
     def clear_database(self):
         """Efface tous les nœuds et relations"""
         print("\n🗑️  Effacement de la base...")
-        with self.driver.session(database=self.config.neo4j_database) as session:
-            result = session.run("MATCH (n) DETACH DELETE n")
-            print(f"  ✅ Base effacée")
+        self.session.run("MATCH (n) DETACH DELETE n")
+        print(f"  ✅ Base effacée")
+
+    def _existing_schema(self) -> Tuple[set, set, set]:
+        """
+        Schéma déjà présent, en un seul aller-retour (SHOW INDEXES) :
+        (noms, (label, propriété) indexés, (label, propriété) portés par une contrainte).
+        Ensembles vides si SHOW INDEXES n'est pas disponible (tout sera tenté).
+        """
+        names, indexed, constrained = set(), set(), set()
+        try:
+            result = self.session.run(
+                "SHOW INDEXES YIELD name, labelsOrTypes, properties, owningConstraint"
+            )
+            for record in result:
+                names.add(record['name'])
+                labels, properties = record['labelsOrTypes'], record['properties']
+                if labels and properties and len(labels) == 1 and len(properties) == 1:
+                    key = (labels[0], properties[0])
+                    indexed.add(key)
+                    if record['owningConstraint']:
+                        constrained.add(key)
+                        # Le nom de la contrainte peut différer de celui de son index
+                        names.add(record['owningConstraint'])
+        except Exception:
+            pass
+        return names, indexed, constrained
 
     def create_constraints(self):
-        """Crée les contraintes d'unicité et index"""
+        """Crée les contraintes d'unicité et index manquants"""
         print("\n🔒 Création des contraintes...")
 
-        constraints = [
-            # Contraintes d'unicité
-            "CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Person) REQUIRE e.id IS UNIQUE",
-            "CREATE CONSTRAINT org_id IF NOT EXISTS FOR (o:Organization) REQUIRE o.id IS UNIQUE",
-            "CREATE CONSTRAINT gpe_id IF NOT EXISTS FOR (g:GPE) REQUIRE g.id IS UNIQUE",
-            "CREATE CONSTRAINT doc_id IF NOT EXISTS FOR (d:ArchiveDocument) REQUIRE d.id IS UNIQUE",
-            "CREATE CONSTRAINT event_id IF NOT EXISTS FOR (e:Event) REQUIRE e.event_id IS UNIQUE",
-            "CREATE CONSTRAINT micro_id IF NOT EXISTS FOR (m:MicroAction) REQUIRE m.micro_id IS UNIQUE",
-
-            # Index pour performance (EXISTANTS)
-            "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.prefLabel_fr)",
-            "CREATE INDEX org_name IF NOT EXISTS FOR (o:Organization) ON (o.prefLabel_fr)",
-            "CREATE INDEX micro_date IF NOT EXISTS FOR (m:MicroAction) ON (m.date_start)",
-            "CREATE INDEX event_date IF NOT EXISTS FOR (e:Event) ON (e.date_start)",
-
-            # NOUVEAUX INDEX (critiques pour relations calculées)
-            "CREATE INDEX micro_actor IF NOT EXISTS FOR (m:MicroAction) ON (m.actor_id)",
-            "CREATE INDEX micro_recipient IF NOT EXISTS FOR (m:MicroAction) ON (m.recipient_id)",
-            "CREATE INDEX micro_about IF NOT EXISTS FOR (m:MicroAction) ON (m.about_id)",
-            "CREATE INDEX event_victim IF NOT EXISTS FOR (e:Event) ON (e.victim_id)",
-            "CREATE INDEX event_date_end IF NOT EXISTS FOR (e:Event) ON (e.date_end)",
-            "CREATE INDEX person_id IF NOT EXISTS FOR (p:Person) ON (p.id)",
-            "CREATE INDEX org_id_lookup IF NOT EXISTS FOR (o:Organization) ON (o.id)"
+        names, indexed, constrained = self._existing_schema()
+
+        statements = [
+            f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+            for name, label, prop in self.UNIQUE_CONSTRAINTS
+            if name not in names and (label, prop) not in constrained
+        ]
+        statements += [
+            f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
+            for name, label, prop in self.INDEXES
+            if name not in names and (label, prop) not in indexed
         ]
 
-        with self.driver.session(database=self.config.neo4j_database) as session:
-            for constraint in constraints:
-                try:
-                    session.run(constraint)
-                except Exception:
-                    pass  # Constraint/index existe déjà
+        for statement in statements:
+            try:
+                self.session.run(statement).consume()
+            except Exception:
+                pass  # Schéma équivalent déjà présent sous un autre nom
 
-        print(f"  ✅ Contraintes et index créés")
+        print(f"  ✅ Contraintes et index créés ({len(statements)} nouveaux)")
 
-    def resolve_entity(self, session, entity_id: str) -> Optional[str]:
+    @staticmethod
+    def _run_statements(tx, statements: List[Tuple[str, List[Dict]]]):
         """
-        Résout une entité (Person ou Organization) par son ID.
-        Retourne le type ('Person', 'Organization') ou None.
+        Fonction de transaction : envoie les requêtes UNWIND à la suite sans lire leurs résultats ;
+        le driver les enchaîne sur la connexion, l'acquittement n'est attendu qu'au commit.
         """
-        # Tester Person
-        result = session.run("""
-            MATCH (p:Person {id: $entity_id})
-            RETURN 'Person' as type
-            LIMIT 1
-        """, entity_id=entity_id)
-
-        record = result.single()
-        if record:
-            return record["type"]
-
-        # Tester Organization
-        result = session.run("""
-            MATCH (o:Organization {id: $entity_id})
-            RETURN 'Organization' as type
-            LIMIT 1
-        """, entity_id=entity_id)
-
-        record = result.single()
-        if record:
-            return record["type"]
+        for query, rows in statements:
+            tx.run(query, rows=rows)
 
-        return None
+    def _write_pipelined(self, jobs: List[Tuple[str, List[Dict]]]):
+        """
+        Écrit des (requête, lignes) dans l'ordre sur la session partagée.
+        Lots de BATCH_SIZE lignes au plus par transaction : les petites requêtes
+        successives partagent la même transaction (un seul commit).
+        """
+        pending = []
+        pending_rows = 0
+        for query, rows in jobs:
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                chunk = rows[start:start + self.BATCH_SIZE]
+                if pending and pending_rows + len(chunk) > self.BATCH_SIZE:
+                    self.session.execute_write(self._run_statements, pending)
+                    pending = []
+                    pending_rows = 0
+                pending.append((query, chunk))
+                pending_rows += len(chunk)
+
+        if pending:
+            self.session.execute_write(self._run_statements, pending)
+
+    def _write_batches(self, query: str, rows: List[Dict]):
+        """Écrit rows par lots de BATCH_SIZE sur la session partagée, une transaction explicite par lot"""
+        self._write_pipelined([(query, rows)])
+
+    def _write_batch_own_session(self, query: str, rows: List[Dict]):
+        """Un lot dans sa propre session (appelé depuis un thread du pool d'écriture)"""
+        with self.driver.session(database=self.config.neo4j_database) as session:
+            session.execute_write(self._run_statements, [(query, rows)])
 
-    def create_microaction_relations(self, session, micro_id: str,
-                                     actor_id: Optional[str] = None,
-                                     recipient_id: Optional[str] = None) -> Tuple[bool, bool]:
+    def _write_batches_concurrent(self, jobs: List[Tuple[str, List[Dict]]]):
         """
-        Crée les relations PERFORMED et RECEIVED pour une MicroAction.
-        Retourne (performed_created, received_created)
+        Écrit des lots (requête, lignes) indépendants sur WRITER_THREADS sessions en parallèle.
+        Retourne une fois tous les lots écrits (barrière) ; la première erreur est relancée.
         """
-        performed_created = False
-        received_created = False
-
-        # PERFORMED (acteur → micro-action)
-        if actor_id:
-            entity_type = self.resolve_entity(session, actor_id)
-            if entity_type:
-                session.run("""
-                    MATCH (m:MicroAction {micro_id: $micro_id})
-                    MATCH (a) WHERE a.id = $actor_id AND (a:Person OR a:Organization)
-                    MERGE (a)-[:PERFORMED]->(m)
-                """, micro_id=micro_id, actor_id=actor_id)
-                performed_created = True
-            else:
-                print(f"    ⚠️  Acteur introuvable : {actor_id}")
-
-        # RECEIVED (micro-action → destinataire)
-        if recipient_id:
-            entity_type = self.resolve_entity(session, recipient_id)
-            if entity_type:
-                session.run("""
-                    MATCH (m:MicroAction {micro_id: $micro_id})
-                    MATCH (r) WHERE r.id = $recipient_id AND (r:Person OR r:Organization)
-                    MERGE (m)-[:RECEIVED]->(r)
-                """, micro_id=micro_id, recipient_id=recipient_id)
-                received_created = True
-            else:
-                print(f"    ⚠️  Destinataire introuvable : {recipient_id}")
-
-        return performed_created, received_created
+        batches = [
+            (query, rows[start:start + self.BATCH_SIZE])
+            for query, rows in jobs
+            for start in range(0, len(rows), self.BATCH_SIZE)
+        ]
+
+        if len(batches) <= 1:
+            self._write_pipelined(batches)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.WRITER_THREADS, len(batches))) as executor:
+            futures = [executor.submit(self._write_batch_own_session, query, rows) for query, rows in batches]
+            for future in futures:
+                future.result()
+
+    def _entity_node_query(self, label: str) -> str:
+        """Requête MERGE du label (construite à la volée pour un label hors ENTITY_NODE_QUERIES)"""
+        query = self.ENTITY_NODE_QUERIES.get(label)
+        if query is None:
+            query = f"""
+                UNWIND $rows AS row
+                MERGE (e:{label} {{id: row.id}})
+                SET e += row.properties
+            """
+        return query
 
     def import_entities(self, entities: List[Dict]):
         """
@@ -394,266 +775,115 @@ class Neo4jClient:
 
         print(f"\n🔥 Import de {len(entities)} entités...")
 
-        # ✨ TRI PAR TYPE : GPE → Organization → Person
-        label_order = {'GPE': 1, 'Organization': 2, 'Person': 3}
-        entities_sorted = sorted(
-            entities,
-            key=lambda e: label_order.get(e['label'], 999)
-        )
+        # ✨ TRI PAR TYPE : GPE → Organization → Person (tri par seaux, stable, une passe)
+        buckets = {'GPE': [], 'Organization': [], 'Person': []}
+        other = []
+        for entity in entities:
+            buckets.get(entity['label'], other).append(entity)
+        entities_sorted = buckets['GPE'] + buckets['Organization'] + buckets['Person'] + other
 
         print(f"  📋 Ordre d'import :")
-        gpe_count = sum(1 for e in entities_sorted if e['label'] == 'GPE')
-        org_count = sum(1 for e in entities_sorted if e['label'] == 'Organization')
-        person_count = sum(1 for e in entities_sorted if e['label'] == 'Person')
-        print(f"     1. {gpe_count} GPE")
-        print(f"     2. {org_count} Organizations")
-        print(f"     3. {person_count} Persons")
+        print(f"     1. {len(buckets['GPE'])} GPE")
+        print(f"     2. {len(buckets['Organization'])} Organizations")
+        print(f"     3. {len(buckets['Person'])} Persons")
+
+        # ============================================================
+        # PASSE 1 : Créer tous les nœuds principaux et structures
+        # ============================================================
+        print(f"  📦 Passe 1/2 : Création des nœuds...")
+
+        # Regroupement en lignes UNWIND : nœuds par label, relations par type
+        nodes_by_label = {}
+        relation_rows = {rel_type: [] for rel_type in self.SPECIFIC_RELATION_QUERIES}
+        reference_rows = []
+
+        for entity in entities_sorted:
+            entity_id = entity['id']
+            nodes_by_label.setdefault(entity['label'], []).append(
+                {'id': entity_id, 'properties': entity['properties']}
+            )
 
-        with self.driver.session(database=self.config.neo4j_database) as session:
-            # ============================================================
-            # PASSE 1 : Créer tous les nœuds principaux et structures
-            # ============================================================
-            print(f"  📦 Passe 1/2 : Création des nœuds...")
-
-            for entity in entities_sorted:
-                label = entity['label']
-                entity_id = entity['id']
-                props = entity['properties']
-
-                # Créer nœud principal
-                query = f"""
-                MERGE (e:{label} {{id: $id}})
-                SET e += $properties
-                """
-                session.run(query, id=entity_id, properties=props)
-                self.stats['entities'] += 1
-
-                # Relations spécifiques (qui ne dépendent pas de structures)
-                for rel_type, targets in entity.get('specific_relations', {}).items():
-                    for target_id in targets:
-                        if rel_type == 'LOCATED_IN':
-                            session.run("""
-                                MATCH (e {id: $entity_id})
-                                MATCH (g:GPE {id: $target_id})
-                                MERGE (e)-[:LOCATED_IN]->(g)
-                            """, entity_id=entity_id, target_id=target_id)
-                            self.stats['relations_located_in'] += 1
-
-                        elif rel_type == 'IS_PART_OF':
-                            session.run("""
-                                MATCH (child {id: $entity_id})
-                                MATCH (parent:Organization {id: $target_id})
-                                MERGE (child)-[:IS_PART_OF]->(parent)
-                            """, entity_id=entity_id, target_id=target_id)
-                            self.stats['relations_is_part_of'] += 1
-
-                        elif rel_type == 'WORKED_FOR':
-                            session.run("""
-                                MATCH (p:Person {id: $entity_id})
-                                MATCH (o:Organization {id: $target_id})
-                                MERGE (p)-[:WORKED_FOR]->(o)
-                            """, entity_id=entity_id, target_id=target_id)
-                            self.stats['relations_worked_for'] += 1
-
-                # Relations génériques REFERENCES
-                for ref_id in entity.get('generic_references', []):
-                    session.run("""
-                        MATCH (e {id: $entity_id})
-                        MATCH (target {id: $ref_id})
-                        MERGE (e)-[:REFERENCES]->(target)
-                    """, entity_id=entity_id, ref_id=ref_id)
-                    self.stats['relations_references'] += 1
-
-                # Créer structures réifiées (SANS relations vers autres entités)
-                for struct_name, items in entity.get('structures', {}).items():
-                    for item in items:
-                        self._create_reified_structure_nodes_only(
-                            session, entity_id, struct_name, item
-                        )
-
-            print(f"  ✅ {self.stats['entities']} entités créées")
-
-            # ============================================================
-            # PASSE 2 : Créer relations entre structures et entités
-            # ============================================================
-            print(f"  🔗 Passe 2/2 : Création des relations...")
-
-            relations_created = 0
-
-            for entity in entities_sorted:
-                entity_id = entity['id']
-
-                for struct_name, items in entity.get('structures', {}).items():
-                    for item in items:
-                        count = self._create_reified_structure_relations(
-                            session, entity_id, struct_name, item
-                        )
-                        relations_created += count
-
-            print(f"  ✅ {relations_created} relations créées entre structures")
-            print(f"  ✅ {self.stats['relations_located_in']} LOCATED_IN")
-            print(f"  ✅ {self.stats['relations_is_part_of']} IS_PART_OF")
-            print(f"  ✅ {self.stats['relations_worked_for']} WORKED_FOR")
-            print(f"  ✅ {self.stats['relations_references']} REFERENCES")
-
-    def _create_reified_structure_nodes_only(self, session, entity_id: str,
-                                             struct_type: str, item: Dict):
-        """
-        Passe 1 : Crée uniquement les nœuds de structures réifiées
-        SANS les relations vers d'autres entités
-        """
-        rid = item.get('rid')
-        props = item.get('properties', {})
-
-        if struct_type == 'occupations':
-            session.run("""
-                MATCH (p:Person {id: $entity_id})
-                CREATE (o:Occupation)
-                SET o = $properties, o.rid = $rid
-                MERGE (p)-[:HAS_OCCUPATION]->(o)
-            """, entity_id=entity_id, rid=rid, properties=props)
-
-        elif struct_type == 'names':
-            session.run("""
-                MATCH (p:Person {id: $entity_id})
-                CREATE (n:Name)
-                SET n = $properties, n.rid = $rid
-                MERGE (p)-[:HAS_NAME]->(n)
-            """, entity_id=entity_id, rid=rid, properties=props)
-
-        elif struct_type == 'origins':
-            session.run("""
-                MATCH (p:Person {id: $entity_id})
-                CREATE (o:Origin)
-                SET o = $properties, o.rid = $rid
-                MERGE (p)-[:HAS_ORIGIN]->(o)
-            """, entity_id=entity_id, rid=rid, properties=props)
-
-        elif struct_type == 'family_relations':
-            session.run("""
-                MATCH (p:Person {id: $entity_id})
-                CREATE (fr:FamilyRelation)
-                SET fr = $properties, fr.rid = $rid
-                MERGE (p)-[:HAS_FAMILY_REL]->(fr)
-            """, entity_id=entity_id, rid=rid, properties=props)
-
-        elif struct_type == 'professional_relations':
-            session.run("""
-                MATCH (p:Person {id: $entity_id})
-                CREATE (pr:ProfessionalRelation)
-                SET pr = $properties, pr.rid = $rid
-                MERGE (p)-[:HAS_PROF_REL]->(pr)
-            """, entity_id=entity_id, rid=rid, properties=props)
-
-        elif struct_type == 'residences':
-            session.run("""
-                        MATCH (p:Person {id: $entity_id})
-                        CREATE (r:Residence)
-                        SET r = $properties, r.rid = $rid
-                        MERGE (p)-[:HAS_RESIDENCE]->(r)
-                    """, entity_id=entity_id, rid=rid, properties=props)
-
-    def _create_reified_structure_relations(self, session, entity_id: str,
-                                            struct_type: str, item: Dict) -> int:
-        """
-        Passe 2 : Crée les relations entre structures réifiées et autres entités
-        ✨ FIX v2.3.2 : Correction props.get('target') + ajout residences
-        """
-        rid = item.get('rid')
-        props = item.get('properties', {})
-        relations_created = 0
-
-        if struct_type == 'occupations':
-            org_id = props.get('organization')
-            place_id = props.get('place')
-
-            if org_id:
-                result = session.run("""
-                    MATCH (o:Occupation {rid: $rid})
-                    MATCH (org:Organization {id: $org_id})
-                    MERGE (o)-[:AT_ORGANIZATION]->(org)
-                    RETURN count(*) as created
-                """, rid=rid, org_id=org_id)
-                if result.single()['created'] > 0:
-                    relations_created += 1
-
-            if place_id:
-                result = session.run("""
-                    MATCH (o:Occupation {rid: $rid})
-                    MATCH (g:GPE {id: $place_id})
-                    MERGE (o)-[:AT_PLACE]->(g)
-                    RETURN count(*) as created
-                """, rid=rid, place_id=place_id)
-                if result.single()['created'] > 0:
-                    relations_created += 1
-
-        elif struct_type == 'origins':
-            place_id = props.get('place')
-            if place_id:
-                result = session.run("""
-                    MATCH (o:Origin {rid: $rid})
-                    MATCH (g:GPE {id: $place_id})
-                    MERGE (o)-[:AT_PLACE]->(g)
-                    RETURN count(*) as created
-                """, rid=rid, place_id=place_id)
-                if result.single()['created'] > 0:
-                    relations_created += 1
-
-        elif struct_type == 'family_relations':
-            # ✅ FIX v2.3.2 : props.get('target')
-            target_id = props.get('target')
-            if target_id:
-                result = session.run("""
-                    MATCH (fr:FamilyRelation {rid: $rid})
-                    MATCH (target:Person {id: $target_id})
-                    MERGE (fr)-[:RELATES_TO]->(target)
-                    RETURN count(*) as created
-                """, rid=rid, target_id=target_id)
-                if result.single()['created'] > 0:
-                    relations_created += 1
-
-        elif struct_type == 'professional_relations':
-            # ✅ FIX v2.3.2 : props.get('target')
-            target_id = props.get('target')
-            if target_id:
-                result = session.run("""
-                    MATCH (pr:ProfessionalRelation {rid: $rid})
-                    MATCH (target {id: $target_id})
-                    MERGE (pr)-[:RELATES_TO]->(target)
-                    RETURN count(*) as created
-                """, rid=rid, target_id=target_id)
-                if result.single()['created'] > 0:
-                    relations_created += 1
-
-            # ✅ FIX v2.3.2 : organization_context
-            org_id = props.get('organization_context')
-            if org_id:
-                result = session.run("""
-                    MATCH (pr:ProfessionalRelation {rid: $rid})
-                    MATCH (org:Organization {id: $org_id})
-                    MERGE (pr)-[:IN_CONTEXT_OF]->(org)
-                    RETURN count(*) as created
-                """, rid=rid, org_id=org_id)
-                if result.single()['created'] > 0:
-                    relations_created += 1
-
-        elif struct_type == 'residences':
-            # ✨ NOUVEAU v2.3.2 : Support résidences
-            place_id = props.get('place')
-            if place_id:
-                result = session.run("""
-                    MATCH (r:Residence {rid: $rid})
-                    MATCH (g:GPE {id: $place_id})
-                    MERGE (r)-[:AT_PLACE]->(g)
-                    RETURN count(*) as created
-                """, rid=rid, place_id=place_id)
-                if result.single()['created'] > 0:
-                    relations_created += 1
-
-        return relations_created
+            # Relations spécifiques (qui ne dépendent pas de structures)
+            for rel_type, targets in entity.get('specific_relations', {}).items():
+                rows = relation_rows.get(rel_type)
+                if rows is not None:
+                    rows.extend({'source': entity_id, 'target': target_id} for target_id in targets)
 
+            # Relations génériques REFERENCES
+            reference_rows.extend(
+                {'source': entity_id, 'target': ref_id} for ref_id in entity.get('generic_references', [])
+            )
+
+        # Nœuds principaux : lots indépendants (aucun MATCH), écrits en parallèle
+        self._write_batches_concurrent([
+            (self._entity_node_query(label), rows) for label, rows in nodes_by_label.items()
+        ])
+        self.stats.entities += len(entities_sorted)
+
+        # Relations créées une fois tous les nœuds présents (après la barrière du pool)
+        jobs = [(query, relation_rows[rel_type]) for rel_type, (query, _) in self.SPECIFIC_RELATION_QUERIES.items()]
+        jobs.append((self.ENTITY_REFERENCES_QUERY, reference_rows))
+        self._write_pipelined(jobs)
+
+        for rel_type, (_, stat_key) in self.SPECIFIC_RELATION_QUERIES.items():
+            setattr(self.stats, stat_key, getattr(self.stats, stat_key) + len(relation_rows[rel_type]))
+        self.stats.relations_references += len(reference_rows)
+
+        # Créer structures réifiées (SANS relations vers autres entités) : un UNWIND par type
+        structures_by_type = {struct_type: [] for struct_type in self.STRUCTURE_NODE_QUERIES}
+        for entity in entities_sorted:
+            entity_id = entity['id']
+            for struct_name, items in entity.get('structures', {}).items():
+                rows = structures_by_type.get(struct_name)
+                if rows is None:
+                    continue
+                rows.extend(
+                    {'entity_id': entity_id, 'rid': item.get('rid'), 'properties': item.get('properties', {})}
+                    for item in items
+                )
 
+        self._write_pipelined([
+            (query, structures_by_type[struct_type]) for struct_type, query in self.STRUCTURE_NODE_QUERIES.items()
+        ])
 
+        print(f"  ✅ {self.stats.entities} entités créées")
+
+        # ============================================================
+        # PASSE 2 : Créer relations entre structures et entités
+        # ============================================================
+        print(f"  🔗 Passe 2/2 : Création des relations...")
+
+        # Lignes (rid, cible) regroupées par requête : une requête par (type, propriété cible)
+        structure_relation_rows = {
+            struct_type: [[] for _ in specs] for struct_type, specs in self.STRUCTURE_RELATION_QUERIES.items()
+        }
+        for entity in entities_sorted:
+            for struct_name, items in entity.get('structures', {}).items():
+                specs = self.STRUCTURE_RELATION_QUERIES.get(struct_name)
+                if specs is None:
+                    continue
+                rows_per_spec = structure_relation_rows[struct_name]
+                for item in items:
+                    rid = item.get('rid')
+                    props = item.get('properties', {})
+                    for (prop_key, _), rows in zip(specs, rows_per_spec):
+                        target_id = props.get(prop_key)
+                        if target_id:
+                            rows.append({'rid': rid, 'target': target_id})
+
+        jobs = [
+            (query, rows)
+            for struct_type, specs in self.STRUCTURE_RELATION_QUERIES.items()
+            for (_, query), rows in zip(specs, structure_relation_rows[struct_type])
+        ]
+        self._write_pipelined(jobs)
+        relations_created = sum(len(rows) for _, rows in jobs)
+
+        print(f"  ✅ {relations_created} relations demandées entre structures")
+        print(f"  ✅ {self.stats.relations_located_in} LOCATED_IN")
+        print(f"  ✅ {self.stats.relations_is_part_of} IS_PART_OF")
+        print(f"  ✅ {self.stats.relations_worked_for} WORKED_FOR")
+        print(f"  ✅ {self.stats.relations_references} REFERENCES")
 
     def import_documents(self, documents: List[Dict]):
         """Import des documents"""
@@ -663,24 +893,20 @@ class Neo4jClient:
 
         print(f"\n📥 Import de {len(documents)} documents...")
 
-        with self.driver.session(database=self.config.neo4j_database) as session:
-            for doc in documents:
-                session.run("""
-                    MERGE (d:ArchiveDocument {id: $id})
-                    SET d += $properties
-                """, id=doc['id'], properties=doc['properties'])
-
-                self.stats['documents'] += 1
+        self._write_batches(self.DOCUMENT_NODE_QUERY, [
+            {'id': doc['id'], 'properties': doc['properties']} for doc in documents
+        ])
+        self.stats.documents += len(documents)
 
-                # Relations REFERENCES
-                for ref_id in doc.get('references', []):
-                    session.run("""
-                        MATCH (d:ArchiveDocument {id: $doc_id})
-                        MATCH (target {id: $ref_id})
-                        MERGE (d)-[:REFERENCES]->(target)
-                    """, doc_id=doc['id'], ref_id=ref_id)
+        # Relations REFERENCES : paires (document, cible) à plat, écrites une fois tous les documents présents
+        reference_rows = [
+            {'source': doc['id'], 'target': ref_id}
+            for doc in documents
+            for ref_id in doc.get('references', [])
+        ]
+        self._write_batches(self.DOCUMENT_REFERENCES_QUERY, reference_rows)
 
-        print(f"  ✅ {self.stats['documents']} documents importés")
+        print(f"  ✅ {self.stats.documents} documents importés")
 
     def import_events(self, events: List[Dict]):
         """
@@ -693,85 +919,59 @@ class Neo4jClient:
 
         print(f"\n📥 Import de {len(events)} événements...")
 
-        with self.driver.session(database=self.config.neo4j_database) as session:
-            for event in events:
-                event_id = event['event_id']
-                props = event['properties'].copy()  # Copie pour modification
-
-                # ✨ FIX v2.3.1 : Parser date_edtf pour créer date_start et date_end
-                if 'date_edtf' in props and props['date_edtf']:
-                    date_info = parse_edtf_date(props['date_edtf'])
-                    props['date_start'] = date_info['date_start']
-                    props['date_end'] = date_info['date_end']
-                    props['date_precision'] = date_info['date_precision']
-
-                    # Calculer gap_flag correctement
-                    props['gap_flag'] = (date_info['date_start'] is None or
-                                         date_info['date_end'] is None)
+        # ✨ FIX v2.3.1 : dates EDTF parsées en une pré-passe, avant toute écriture
+        dated_properties = [_enrich_dates(event['properties']) for event in events]
+
+        entity_labels = self._entity_labels()
+
+        rows = []
+        for event, props in zip(events, dated_properties):
+            assertion = event['assertion']
+            row = {
+                'event_id': event['event_id'],
+                'properties': props,
+                'doc_id': assertion['doc_id'],
+                'assertion_id': assertion['assertion_id'],
+                'assertion_properties': assertion['properties'],
+                'victim_id': props.get('victim_id') or None,
+                'agent_person_id': None,
+                'agent_org_id': None,
+                'agent_other_id': None,
+                'place_id': props.get('place_id') or None,
+                'references': list(event.get('references', []))
+            }
+
+            agent_id = props.get('agent_id')
+            if agent_id and agent_id != 'UNKNOWN_AUTHORITY':
+                label = entity_labels.get(agent_id)
+                if label == 'Person':
+                    row['agent_person_id'] = agent_id
+                elif label == 'Organization':
+                    row['agent_org_id'] = agent_id
                 else:
-                    # Pas de date EDTF
-                    props['date_start'] = None
-                    props['date_end'] = None
-                    props['date_precision'] = 'unknown'
-                    props['gap_flag'] = True
-
-                # Créer Event avec MERGE (gestion doublons)
-                session.run("""
-                    MERGE (e:Event {event_id: $event_id})
-                    SET e += $properties
-                """, event_id=event_id, properties=props)
-
-                self.stats['events'] += 1
-
-                # Créer Assertion
-                assertion = event['assertion']
-                session.run("""
-                    MATCH (e:Event {event_id: $event_id})
-                    MATCH (d:ArchiveDocument {id: $doc_id})
-                    MERGE (a:Assertion {assertion_id: $assertion_id})
-                    SET a += $assertion_props
-                    MERGE (d)-[:SUPPORTS]->(a)
-                    MERGE (a)-[:CLAIMS]->(e)
-                """,
-                            event_id=event_id,
-                            doc_id=assertion['doc_id'],
-                            assertion_id=assertion['assertion_id'],
-                            assertion_props=assertion['properties']
-                            )
-
-                # Relations spécifiques (victim, agent, place)
-                if props.get('victim_id'):
-                    session.run("""
-                        MATCH (e:Event {event_id: $event_id})
-                        MATCH (v:Person {id: $victim_id})
-                        MERGE (v)-[:WAS_VICTIM_OF]->(e)
-                    """, event_id=event_id, victim_id=props['victim_id'])
-
-                if props.get('agent_id') and props['agent_id'] != 'UNKNOWN_AUTHORITY':
-                    session.run("""
-                        MATCH (e:Event {event_id: $event_id})
-                        MATCH (a {id: $agent_id})
-                        MERGE (a)-[:ACTED_AS_AGENT]->(e)
-                    """, event_id=event_id, agent_id=props['agent_id'])
-
-                if props.get('place_id'):
-                    session.run("""
-                        MATCH (e:Event {event_id: $event_id})
-                        MATCH (p:GPE {id: $place_id})
-                        MERGE (e)-[:OCCURRED_AT]->(p)
-                    """, event_id=event_id, place_id=props['place_id'])
-
-                # Relations génériques REFERENCES
-                for ref_id in event.get('references', []):
-                    session.run("""
-                        MATCH (e:Event {event_id: $event_id})
-                        MATCH (target {id: $ref_id})
-                        MERGE (e)-[:REFERENCES]->(target)
-                    """, event_id=event_id, ref_id=ref_id)
-
-                self.stats['relations_participated'] += 1
-
-        print(f"  ✅ {self.stats['events']} événements importés")
+                    row['agent_other_id'] = agent_id
+
+            rows.append(row)
+
+        self._write_batches(self.EVENT_IMPORT_QUERY, rows)
+
+        self.stats.events += len(rows)
+        self.stats.relations_participated += len(rows)
+
+        print(f"  ✅ {self.stats.events} événements importés")
+
+    def _entity_labels(self) -> Dict[str, str]:
+        """
+        id → label des Person/Organization en base, chargé en un seul aller-retour
+        puis conservé pour la durée de l'import (les entités sont importées avant).
+        """
+        if self._entity_label_cache is None:
+            result = self.session.run("""
+                MATCH (n) WHERE n:Person OR n:Organization
+                RETURN n.id AS id, CASE WHEN n:Person THEN 'Person' ELSE 'Organization' END AS label
+            """)
+            self._entity_label_cache = {record['id']: record['label'] for record in result}
+        return self._entity_label_cache
 
     def import_microactions(self, microactions: List[Dict]):
         """
@@ -787,92 +987,91 @@ class Neo4jClient:
         performed_count = 0
         received_count = 0
 
-        with self.driver.session(database=self.config.neo4j_database) as session:
-            for micro in microactions:
-                micro_id = micro['micro_id']
-                props = micro['properties'].copy()  # Copie pour modification
-
-                # ✨ FIX v2.3.1 : Parser date_edtf pour créer date_start et date_end
-                if 'date_edtf' in props and props['date_edtf']:
-                    date_info = parse_edtf_date(props['date_edtf'])
-                    props['date_start'] = date_info['date_start']
-                    props['date_end'] = date_info['date_end']
-                    props['date_precision'] = date_info['date_precision']
-
-                    # Calculer gap_flag correctement
-                    props['gap_flag'] = (date_info['date_start'] is None or
-                                         date_info['date_end'] is None)
+        # ✨ FIX v2.3.1 : dates EDTF parsées en une pré-passe, avant toute écriture
+        dated_properties = [_enrich_dates(micro['properties']) for micro in microactions]
+
+        entity_labels = self._entity_labels()
+
+        # Avertissements bufferisés, affichés en un seul bloc après l'import
+        missing_actors = []
+        missing_recipients = []
+
+        rows = []
+        for micro, props in zip(microactions, dated_properties):
+            assertion = micro['assertion']
+            row = {
+                'micro_id': micro['micro_id'],
+                'properties': props,
+                'doc_id': assertion['doc_id'],
+                'assertion_id': assertion['assertion_id'],
+                'assertion_properties': assertion['properties'],
+                'actor_person_id': None,
+                'actor_org_id': None,
+                'recipient_person_id': None,
+                'recipient_org_id': None,
+                'about_id': props.get('about_id'),
+                'references': list(micro.get('references', []))
+            }
+
+            # Acteur / destinataire résolus ici : id placé sous le champ de son label
+            actor_id = props.get('actor_id')
+            if actor_id:
+                label = entity_labels.get(actor_id)
+                if label:
+                    row['actor_person_id' if label == 'Person' else 'actor_org_id'] = actor_id
+                    performed_count += 1
                 else:
-                    # Pas de date EDTF
-                    props['date_start'] = None
-                    props['date_end'] = None
-                    props['date_precision'] = 'unknown'
-                    props['gap_flag'] = True
-
-                # Créer MicroAction avec MERGE (gestion doublons)
-                session.run("""
-                    MERGE (m:MicroAction {micro_id: $micro_id})
-                    SET m += $properties
-                """, micro_id=micro_id, properties=props)
-
-                self.stats['microactions'] += 1
-
-                # Créer Assertion
-                assertion = micro['assertion']
-                session.run("""
-                    MATCH (m:MicroAction {micro_id: $micro_id})
-                    MATCH (d:ArchiveDocument {id: $doc_id})
-                    MERGE (a:Assertion {assertion_id: $assertion_id})
-                    SET a += $assertion_props
-                    MERGE (d)-[:SUPPORTS]->(a)
-                    MERGE (a)-[:CLAIMS]->(m)
-                """,
-                            micro_id=micro_id,
-                            doc_id=assertion['doc_id'],
-                            assertion_id=assertion['assertion_id'],
-                            assertion_props=assertion['properties']
-                            )
-
-                # Créer PERFORMED et RECEIVED
-                perf, recv = self.create_microaction_relations(
-                    session,
-                    micro_id=micro_id,
-                    actor_id=props.get('actor_id'),
-                    recipient_id=props.get('recipient_id')
-                )
+                    missing_actors.append(actor_id)
 
-                if perf:
-                    performed_count += 1
-                if recv:
+            recipient_id = props.get('recipient_id')
+            if recipient_id:
+                label = entity_labels.get(recipient_id)
+                if label:
+                    row['recipient_person_id' if label == 'Person' else 'recipient_org_id'] = recipient_id
                     received_count += 1
+                else:
+                    missing_recipients.append(recipient_id)
+
+            rows.append(row)
+
+        # Nœuds répartis sur WRITER_THREADS sessions : partition par micro_id, une même
+        # micro-action (et son assertion) reste dans un seul shard
+        shards = [[] for _ in range(self.WRITER_THREADS)]
+        for row in rows:
+            shards[hash(row['micro_id']) % self.WRITER_THREADS].append(row)
+        self._write_batches_concurrent([(self.MICROACTION_NODE_QUERY, shard) for shard in shards])
+
+        # Relations vers les nœuds partagés : en séquence, une fois tous les nœuds écrits
+        self._write_pipelined([(self.MICROACTION_RELATION_QUERY, rows)])
+
+        self.stats.microactions += len(rows)
+        self.stats.relations_concerns += sum(1 for row in rows if row['about_id'])
+
+        self.stats.relations_performed = performed_count
+        self.stats.relations_received = received_count
 
-                # Créer CONCERNS (lien principal vers personne concernée)
-                if props.get('about_id'):
-                    try:
-                        session.run("""
-                            MATCH (m:MicroAction {micro_id: $micro_id})
-                            MATCH (p:Person {id: $about_id})
-                            MERGE (m)-[:CONCERNS]->(p)
-                        """, micro_id=micro_id, about_id=props['about_id'])
-                        self.stats['relations_concerns'] += 1
-                    except Exception as e:
-                        print(f"    ⚠️  Erreur CONCERNS pour {micro_id}: {e}")
-
-                # Relations génériques REFERENCES
-                for ref_id in micro.get('references', []):
-                    session.run("""
-                        MATCH (m:MicroAction {micro_id: $micro_id})
-                        MATCH (target {id: $ref_id})
-                        MERGE (m)-[:REFERENCES]->(target)
-                    """, micro_id=micro_id, ref_id=ref_id)
-
-        self.stats['relations_performed'] = performed_count
-        self.stats['relations_received'] = received_count
-
-        print(f"  ✅ {self.stats['microactions']} micro-actions importées")
+        print(f"  ✅ {self.stats.microactions} micro-actions importées")
         print(f"  ✅ {performed_count} relations PERFORMED créées")
         print(f"  ✅ {received_count} relations RECEIVED créées")
-        print(f"  ✅ {self.stats['relations_concerns']} relations CONCERNS créées")
+        print(f"  ✅ {self.stats.relations_concerns} relations CONCERNS créées")
+
+        self._print_missing("Acteur introuvable", missing_actors)
+        self._print_missing("Destinataire introuvable", missing_recipients)
+
+    @staticmethod
+    def _print_missing(message: str, ids: List[str]):
+        """Résumé des ids introuvables : une ligne par id distinct (avec nombre d'occurrences), un seul print"""
+        if not ids:
+            return
+        counts = {}
+        for entity_id in ids:
+            counts[entity_id] = counts.get(entity_id, 0) + 1
+        lines = [f"  ⚠️  {message} : {len(ids)} occurrences, {len(counts)} ids distincts"]
+        lines.extend(
+            f"    ⚠️  {message} : {entity_id}" + (f" (×{count})" if count > 1 else "")
+            for entity_id, count in counts.items()
+        )
+        print("\n".join(lines))
 
 
 # ============================================================================
@@ -886,21 +1085,86 @@ class Validator:
         self.config = config
         self.report = []
 
+    # Tous les comptages de validation en une requête (un aller-retour au lieu de onze).
+    # Les comptes « un label, sans filtre » et « un type de relation, extrémités sans label »
+    # sont lus dans le counts store de Neo4j (O(1)) : chaque label d'entité est compté à part
+    # (une disjonction e:Person OR ... forcerait un parcours des nœuds).
+    # La somme suppose un seul label d'entité par nœud : vrai pour les nœuds créés par
+    # ENTITY_NODE_QUERIES (un MERGE par label) ; un nœud Person:Organization ajouté à la main
+    # serait compté deux fois, là où la disjonction le comptait une fois.
+    COUNTS_QUERY = """
+        CALL {
+            MATCH (p:Person) RETURN count(p) AS c
+            UNION ALL
+            MATCH (o:Organization) RETURN count(o) AS c
+            UNION ALL
+            MATCH (g:GPE) RETURN count(g) AS c
+        }
+        WITH sum(c) AS entities
+        CALL {
+            MATCH (d:ArchiveDocument)
+            RETURN count(d) AS documents
+        }
+        CALL {
+            MATCH (e:Event)
+            RETURN count(e) AS events
+        }
+        CALL {
+            MATCH (m:MicroAction)
+            RETURN count(m) AS microactions
+        }
+        CALL {
+            MATCH ()-[r:PERFORMED]->()
+            RETURN count(r) AS performed
+        }
+        CALL {
+            MATCH ()-[r:RECEIVED]->()
+            RETURN count(r) AS received
+        }
+        CALL {
+            MATCH ()-[r:CONCERNS]->()
+            RETURN count(r) AS concerns
+        }
+        CALL {
+            MATCH (m:MicroAction)
+            RETURN count(m.actor_id) AS performed_expected,
+                   count(m.recipient_id) AS received_expected,
+                   count(m.about_id) AS concerns_expected
+        }
+        CALL {
+            MATCH (e:Event)
+            WHERE e.date_edtf IS NOT NULL
+            RETURN count(e) AS with_edtf,
+                   count(CASE WHEN e.date_start IS NOT NULL OR e.date_end IS NOT NULL THEN 1 END) AS parsed
+        }
+        RETURN entities, documents, events, microactions,
+               performed, performed_expected, received, received_expected,
+               concerns, concerns_expected, with_edtf, parsed
+    """
+
+    # Relations micro-action vérifiées depuis le même enregistrement COUNTS_QUERY
+    RELATION_CHECKS = (
+        ('PERFORMED', 'performed'),
+        ('RECEIVED', 'received'),
+        ('CONCERNS', 'concerns')
+    )
+
     def validate_all(self, driver) -> bool:
         """Exécute toutes les validations"""
         print("\n🔍 Validation de l'import...")
 
         with driver.session(database=self.config.neo4j_database) as session:
-            checks = [
-                self._check_entities(session),
-                self._check_documents(session),
-                self._check_events(session),
-                self._check_microactions(session),
-                self._check_relations_performed(session),
-                self._check_relations_received(session),
-                self._check_relations_concerns(session),
-                self._check_dates_parsed(session)
-            ]
+            counts = session.run(self.COUNTS_QUERY).single()
+
+        checks = [
+            self._check_entities(counts),
+            self._check_documents(counts),
+            self._check_events(counts),
+            self._check_microactions(counts),
+            *(self._check_relations(counts, rel_type, key)
+              for rel_type, key in self.RELATION_CHECKS),
+            self._check_dates_parsed(counts)
+        ]
 
         all_valid = all(checks)
 
@@ -911,13 +1175,9 @@ class Validator:
 
         return all_valid
 
-    def _check_entities(self, session) -> bool:
+    def _check_entities(self, counts) -> bool:
         """Vérifie les entités"""
-        result = session.run("""
-            MATCH (e) WHERE e:Person OR e:Organization OR e:GPE
-            RETURN count(e) as count
-        """)
-        count = result.single()["count"]
+        count = counts["entities"]
 
         status = "✅" if count > 0 else "❌"
         self.report.append(f"{status} Entités : {count}")
@@ -925,10 +1185,9 @@ class Validator:
 
         return count > 0
 
-    def _check_documents(self, session) -> bool:
+    def _check_documents(self, counts) -> bool:
         """Vérifie les documents"""
-        result = session.run("MATCH (d:ArchiveDocument) RETURN count(d) as count")
-        count = result.single()["count"]
+        count = counts["documents"]
 
         status = "✅" if count > 0 else "⚠️ "
         self.report.append(f"{status} Documents : {count}")
@@ -936,10 +1195,9 @@ class Validator:
 
         return True
 
-    def _check_events(self, session) -> bool:
+    def _check_events(self, counts) -> bool:
         """Vérifie les événements"""
-        result = session.run("MATCH (e:Event) RETURN count(e) as count")
-        count = result.single()["count"]
+        count = counts["events"]
 
         status = "✅" if count > 0 else "⚠️ "
         self.report.append(f"{status} Événements : {count}")
@@ -947,10 +1205,9 @@ class Validator:
 
         return True
 
-    def _check_microactions(self, session) -> bool:
+    def _check_microactions(self, counts) -> bool:
         """Vérifie les micro-actions"""
-        result = session.run("MATCH (m:MicroAction) RETURN count(m) as count")
-        count = result.single()["count"]
+        count = counts["microactions"]
 
         status = "✅" if count > 0 else "⚠️ "
         self.report.append(f"{status} Micro-actions : {count}")
@@ -958,90 +1215,24 @@ class Validator:
 
         return True
 
-    def _check_relations_performed(self, session) -> bool:
-        """Vérifie les relations PERFORMED"""
-        result = session.run("""
-            MATCH ()-[r:PERFORMED]->()
-            RETURN count(r) as count
-        """)
-        count = result.single()["count"]
-
-        # Vérifier cohérence
-        result2 = session.run("""
-            MATCH (m:MicroAction)
-            WHERE m.actor_id IS NOT NULL
-            RETURN count(m) as count
-        """)
-        expected = result2.single()["count"]
-
-        status = "✅" if count == expected else "⚠️ "
-        self.report.append(f"{status} Relations PERFORMED : {count}/{expected}")
-        print(f"  {status} {count}/{expected} relations PERFORMED")
-
-        return count == expected
-
-    def _check_relations_received(self, session) -> bool:
-        """Vérifie les relations RECEIVED"""
-        result = session.run("""
-            MATCH ()-[r:RECEIVED]->()
-            RETURN count(r) as count
-        """)
-        count = result.single()["count"]
+    def _check_relations(self, counts, rel_type: str, key: str) -> bool:
+        """Vérifie un type de relation micro-action contre les *_id renseignés"""
+        count = counts[key]
 
         # Vérifier cohérence
-        result2 = session.run("""
-            MATCH (m:MicroAction)
-            WHERE m.recipient_id IS NOT NULL
-            RETURN count(m) as count
-        """)
-        expected = result2.single()["count"]
+        expected = counts[f"{key}_expected"]
 
         status = "✅" if count == expected else "⚠️ "
-        self.report.append(f"{status} Relations RECEIVED : {count}/{expected}")
-        print(f"  {status} {count}/{expected} relations RECEIVED")
+        self.report.append(f"{status} Relations {rel_type} : {count}/{expected}")
+        print(f"  {status} {count}/{expected} relations {rel_type}")
 
         return count == expected
 
-    def _check_relations_concerns(self, session) -> bool:
-        """Vérifie les relations CONCERNS"""
-        result = session.run("""
-            MATCH ()-[r:CONCERNS]->()
-            RETURN count(r) as count
-        """)
-        count = result.single()["count"]
-
-        # Vérifier cohérence
-        result2 = session.run("""
-            MATCH (m:MicroAction)
-            WHERE m.about_id IS NOT NULL
-            RETURN count(m) as count
-        """)
-        expected = result2.single()["count"]
-
-        status = "✅" if count == expected else "⚠️ "
-        self.report.append(f"{status} Relations CONCERNS : {count}/{expected}")
-        print(f"  {status} {count}/{expected} relations CONCERNS")
-
-        return count == expected
-
-    def _check_dates_parsed(self, session) -> bool:
+    def _check_dates_parsed(self, counts) -> bool:
         """✨ v2.3.1 : Vérifie parsing complet des dates"""
-        # Compter Events avec date_edtf
-        result_edtf = session.run("""
-            MATCH (e:Event) 
-            WHERE e.date_edtf IS NOT NULL 
-            RETURN count(e) as count
-        """)
-        with_edtf = result_edtf.single()["count"]
-
-        # Compter Events avec date_start OU date_end créé
-        result_parsed = session.run("""
-            MATCH (e:Event) 
-            WHERE e.date_edtf IS NOT NULL 
-              AND (e.date_start IS NOT NULL OR e.date_end IS NOT NULL)
-            RETURN count(e) as count
-        """)
-        parsed = result_parsed.single()["count"]
+        # Events avec date_edtf, et parmi eux ceux avec date_start OU date_end créé
+        with_edtf = counts["with_edtf"]
+        parsed = counts["parsed"]
 
         # ✨ v2.3.1 : Accepter que certains events aient date_start=null OU date_end=null
         # (dates ouvertes), mais tous doivent avoir AU MOINS une des deux
@@ -1052,7 +1243,7 @@ class Validator:
 
         return parsed == with_edtf
 
-    def generate_markdown_report(self, stats: Dict, output_file: str = "import_report.md"):
+    def generate_markdown_report(self, stats: ImportStats, output_file: str = "import_report.md"):
         """Génère un rapport Markdown"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -1064,17 +1255,17 @@ class Validator:
             f.write("## 📊 Statistiques d'import\n\n")
             f.write("| Élément | Nombre |\n")
             f.write("|---------|--------|\n")
-            f.write(f"| Entités | {stats['entities']} |\n")
-            f.write(f"| Documents | {stats['documents']} |\n")
-            f.write(f"| Événements | {stats['events']} |\n")
-            f.write(f"| Micro-actions | {stats['microactions']} |\n")
-            f.write(f"| Relations PERFORMED | {stats['relations_performed']} |\n")
-            f.write(f"| Relations RECEIVED | {stats['relations_received']} |\n")
-            f.write(f"| Relations CONCERNS | {stats.get('relations_concerns', 0)} |\n")
-            f.write(f"| Relations LOCATED_IN | {stats['relations_located_in']} |\n")
-            f.write(f"| Relations IS_PART_OF | {stats['relations_is_part_of']} |\n")
-            f.write(f"| Relations WORKED_FOR | {stats['relations_worked_for']} |\n")
-            f.write(f"| Relations REFERENCES | {stats['relations_references']} |\n")
+            f.write(f"| Entités | {stats.entities} |\n")
+            f.write(f"| Documents | {stats.documents} |\n")
+            f.write(f"| Événements | {stats.events} |\n")
+            f.write(f"| Micro-actions | {stats.microactions} |\n")
+            f.write(f"| Relations PERFORMED | {stats.relations_performed} |\n")
+            f.write(f"| Relations RECEIVED | {stats.relations_received} |\n")
+            f.write(f"| Relations CONCERNS | {stats.relations_concerns} |\n")
+            f.write(f"| Relations LOCATED_IN | {stats.relations_located_in} |\n")
+            f.write(f"| Relations IS_PART_OF | {stats.relations_is_part_of} |\n")
+            f.write(f"| Relations WORKED_FOR | {stats.relations_worked_for} |\n")
+            f.write(f"| Relations REFERENCES | {stats.relations_references} |\n")
             f.write("\n")
 
             f.write("## ✅ Validation\n\n")
@@ -1106,6 +1297,11 @@ def main():
         default='config.json',
         help='Fichier de configuration (défaut: config.json)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignorer le cache de parsing (<vault>/.cache/)'
+    )
 
     args = parser.parse_args()
 
@@ -1126,6 +1322,7 @@ def main():
     # Import parsers depuis utils/
     try:
         from utils import EntityParser, DocumentParser, EventParser, MicroActionParser
+        from utils.vault_scan import VaultIndex
     except ImportError as e:
         print(f"❌ Erreur import modules utils/ : {e}")
         print("   Vérifiez que les fichiers suivants existent :")
@@ -1155,25 +1352,42 @@ def main():
         }
     }
 
-    entity_parser = EntityParser(vault_path, config_dict, folders_paths)
-    doc_parser = DocumentParser(vault_path, config_dict, folders_paths)
-    event_parser = EventParser(vault_path, config_dict, folders_paths)
-    micro_parser = MicroActionParser(vault_path, config_dict, folders_paths)
-
-    print("\n📖 Parsing des entités (toutes)...")
-    entities, entity_warnings = entity_parser.parse_all()
+    cache_dir = None if args.no_cache else vault_path / ".cache"
+
+    # Un seul parcours du vault, liste de fichiers partagée par les quatre parsers
+    vault_index = VaultIndex(vault_path)
+
+    # Les quatre parsers tournent en parallèle, chacun avec son propre process pool :
+    # les cœurs sont répartis entre les quatre pools
+    parser_workers = max(1, (os.cpu_count() or 1) // 4)
+
+    entity_parser = EntityParser(vault_path, config_dict, folders_paths, workers=parser_workers,
+                                 vault_index=vault_index)
+    doc_parser = DocumentParser(vault_path, config_dict, folders_paths,
+                                cache_path=cache_dir / "documents.json" if cache_dir else None,
+                                workers=parser_workers, vault_index=vault_index)
+    event_parser = EventParser(vault_path, config_dict, folders_paths, workers=parser_workers,
+                               vault_index=vault_index)
+    micro_parser = MicroActionParser(vault_path, config_dict, folders_paths, workers=parser_workers,
+                                     vault_index=vault_index)
+
+    print("\n📖 Parsing des entités (toutes), documents, événements et micro-actions...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        entity_future = executor.submit(entity_parser.parse_all)
+        doc_future = executor.submit(doc_parser.parse_all)
+        event_future = executor.submit(event_parser.parse_all)
+        micro_future = executor.submit(micro_parser.parse_all)
+
+    entities, entity_warnings = entity_future.result()
     print(f"  ✅ {len(entities)} entités parsées")
 
-    print(f"\n📖 Parsing des documents...")
-    documents, doc_warnings = doc_parser.parse_all()
+    documents, doc_warnings = doc_future.result()
     print(f"  ✅ {len(documents)} documents parsés")
 
-    print(f"\n📖 Parsing des événements...")
-    events, event_warnings = event_parser.parse_all()
+    events, event_warnings = event_future.result()
     print(f"  ✅ {len(events)} événements parsés")
 
-    print(f"\n📖 Parsing des micro-actions...")
-    microactions, micro_warnings = micro_parser.parse_all()
+    microactions, micro_warnings = micro_future.result()
     print(f"  ✅ {len(microactions)} micro-actions parsées")
 
     # Import Neo4j
@@ -1204,20 +1418,20 @@ def main():
 
             calculator = RelationCalculator(config.__dict__)
 
-            with client.driver.session(database=config.neo4j_database) as session:
-                print("\n🔗 Calcul des relations...")
+            session = client.session
+            print("\n🔗 Calcul des relations...")
 
-                count_replies = calculator.calculate_replies_to(session)
-                print(f"  ✅ {count_replies} REPLIES_TO créées")
+            count_replies = calculator.calculate_replies_to(session)
+            print(f"  ✅ {count_replies} REPLIES_TO créées")
 
-                count_chain = calculator.calculate_next_in_chain(session)
-                print(f"  ✅ {count_chain} NEXT_IN_COMMUNICATION_CHAIN créées")
+            count_chain = calculator.calculate_next_in_chain(session)
+            print(f"  ✅ {count_chain} NEXT_IN_COMMUNICATION_CHAIN créées")
 
-                count_context = calculator.calculate_acted_in_context(session)
-                print(f"  ✅ {count_context} ACTED_IN_CONTEXT_OF créées")
+            count_context = calculator.calculate_acted_in_context(session)
+            print(f"  ✅ {count_context} ACTED_IN_CONTEXT_OF créées")
 
-                count_timeline = calculator.calculate_case_timeline(session)
-                print(f"  ✅ {count_timeline} FOLLOWS_IN_CASE créées")
+            count_timeline = calculator.calculate_case_timeline(session)
+            print(f"  ✅ {count_timeline} FOLLOWS_IN_CASE créées")
 
         # Validation
         print("\n" + "=" * 70)
@@ -1235,34 +1449,33 @@ def main():
             print("PHASE 3.5 : ENRICHISSEMENT REFERENCES")
             print("=" * 70)
 
-            with client.driver.session(database=config.neo4j_database) as session:
-                print("\n🔗 Enrichissement relations REFERENCES...")
+            print("\n🔗 Enrichissement relations REFERENCES...")
 
-                result = session.run("""
-                        MATCH (source)-[r:REFERENCES]->(target)
-                        WHERE r.entity_prefLabel IS NULL
+            result = client.session.run("""
+                    MATCH (source)-[r:REFERENCES]->(target)
+                    WHERE r.entity_prefLabel IS NULL
 
-                        WITH source, r, target
-                        SET r.entity_prefLabel = target.prefLabel_fr,
-                            r.entity_type = labels(target)[0]
+                    WITH source, r, target
+                    SET r.entity_prefLabel = target.prefLabel_fr,
+                        r.entity_type = labels(target)[0]
 
-                        RETURN count(r) as enriched
-                    """)
+                    RETURN count(r) as enriched
+                """)
 
-                enriched_count = result.single()['enriched']
-                print(f"  ✅ {enriched_count} relations REFERENCES enrichies")
+            enriched_count = result.single()['enriched']
+            print(f"  ✅ {enriched_count} relations REFERENCES enrichies")
 
         print("\n" + "=" * 70)
         print("✅ IMPORT TERMINÉ AVEC SUCCÈS")
         print("=" * 70)
         print(f"\n📊 Résumé :")
-        print(f"  - {client.stats['entities']} entités")
-        print(f"  - {client.stats['documents']} documents")
-        print(f"  - {client.stats['events']} événements")
-        print(f"  - {client.stats['microactions']} micro-actions")
-        print(f"  - {client.stats['relations_performed']} PERFORMED")
-        print(f"  - {client.stats['relations_received']} RECEIVED")
-        print(f"  - {client.stats['relations_concerns']} CONCERNS")
+        print(f"  - {client.stats.entities} entités")
+        print(f"  - {client.stats.documents} documents")
+        print(f"  - {client.stats.events} événements")
+        print(f"  - {client.stats.microactions} micro-actions")
+        print(f"  - {client.stats.relations_performed} PERFORMED")
+        print(f"  - {client.stats.relations_received} RECEIVED")
+        print(f"  - {client.stats.relations_concerns} CONCERNS")
 
     except Exception as e:
         print(f"\n❌ ERREUR : {e}")
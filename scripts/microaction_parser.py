@@ -5,10 +5,20 @@ Parser pour micro-actions depuis documents
 
 import re
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from .wikilink_extractor import WikilinkExtractor, WikilinkWarnings
 from .edtf_parser import EDTFParser
+from .document_ids import document_base_id
+from .vault_scan import VaultIndex, markdown_files, folder_prefixes
+from .parallel import map_jobs
+
+
+@lru_cache(maxsize=8192)
+def _id_digest(s: str) -> str:
+    """BLAKE2b-128 hexadécimal mémoïsé (empreinte non cryptographique, comme les doc_id)"""
+    return hashlib.blake2b(s.encode('utf-8'), digest_size=16).hexdigest()
 
 
 class MicroActionParser:
@@ -20,13 +30,19 @@ class MicroActionParser:
     )
     KV_RE = re.compile(r'^\s*-\s*([A-Za-z0-9_]+)\s*:\s*(.+?)\s*$')
 
-    REPLY_DATE_PATTERNS = [
+    # Motifs de date de réponse, par ordre de priorité
+    REPLY_DATE_PATTERNS = (
         (r'Schreiben\s+vom\s+(\d{4}-\d{2}-\d{2})', 'iso'),
         (r'vom\s+(\d{1,2})\.\s*(\w+)\s+(\d{4})', 'de_long'),
         (r'Telegramm\s+(?:Nr\.\s*\d+\s+)?vom\s+(\d{2}\.\d{2}\.\d{4})', 'de_dot'),
         (r'lettre\s+du\s+(\d{1,2})\s+(\w+)\s+(\d{4})', 'fr_long'),
         (r'télégramme\s+du\s+(\d{2}\.\d{2}\.\d{4})', 'fr_dot')
-    ]
+    )
+    # Une seule alternation (un groupe nommé par motif) : le texte est parcouru une fois
+    REPLY_DATE_RE = re.compile(
+        '|'.join(f'(?P<{date_type}>{pattern})' for pattern, date_type in REPLY_DATE_PATTERNS),
+        re.IGNORECASE
+    )
 
     MONTH_NAMES = {
         'januar': 1, 'februar': 2, 'märz': 3, 'april': 4,
@@ -37,32 +53,37 @@ class MicroActionParser:
         'novembre': 11, 'décembre': 12
     }
 
-    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None):
+    def __init__(self, vault_path: Path, config: dict, folders: Optional[List[Path]] = None,
+                 workers: Optional[int] = None, vault_index: Optional[VaultIndex] = None):
         self.vault_path = vault_path
         self.config = config
         self.folders = folders
+        self._folder_prefixes = folder_prefixes(folders)
+        self.workers = workers
+        self.vault_index = vault_index
 
     def _should_process_file(self, file_path: Path) -> bool:
         """Vérifie si le fichier doit être parsé selon les dossiers sélectionnés"""
-        if not self.folders:
-            return True
-
-        return any(file_path.is_relative_to(folder) for folder in self.folders)
+        return not self._folder_prefixes or str(file_path).startswith(self._folder_prefixes)
 
     def parse_all(self) -> Tuple[List[Dict[str, Any]], WikilinkWarnings]:
         """Parse toutes les micro-actions"""
         microactions = []
         warnings = WikilinkWarnings()
 
-        for file_path in self.vault_path.rglob("*.md"):
-            if not self._should_process_file(file_path):
-                continue
+        jobs = [
+            (self.vault_path, file_path)
+            for file_path in markdown_files(self.vault_path, self.vault_index)
+            if self._should_process_file(file_path)
+        ]
 
-            try:
-                doc_micros = self._parse_microactions_from_file(file_path, warnings)
-                microactions.extend(doc_micros)
-            except Exception as e:
-                warnings.log_parse_error(str(file_path), f"{type(e).__name__}: {str(e)}")
+        results = map_jobs(_parse_microactions_worker, jobs, self.workers)
+
+        for (_, file_path), (doc_micros, file_warnings, error) in zip(jobs, results):
+            warnings.merge(file_warnings)
+            microactions.extend(doc_micros)
+            if error:
+                warnings.log_parse_error(str(file_path), error)
 
         return microactions, warnings
 
@@ -70,6 +91,10 @@ class MicroActionParser:
         """Parse micro-actions depuis un fichier"""
         text = file_path.read_text(encoding='utf-8')
 
+        # La plupart des notes n'ont aucune micro-action : test littéral avant toute regex
+        if '#micro_id:' not in text:
+            return []
+
         doc_id = self._build_document_id_from_path(file_path)
 
         microactions = []
@@ -134,20 +159,18 @@ class MicroActionParser:
 
         # Extraction in_reply_to_date
         in_reply_to_date = data.get('in_reply_to_date')
-        link_type = data.get('link_type', '')
-
-        if not in_reply_to_date:
-            if 'acknowledges_receipt' in link_type or 'replies_to' in link_type:
-                full_text = ' '.join([
-                    data.get('description', ''),
-                    data.get('observations', '')
-                ])
-                in_reply_to_date = self._extract_reply_date(full_text)
-
-                if in_reply_to_date:
-                    warnings.log_in_reply_to_date_extracted(file_path, micro_id, in_reply_to_date)
-                else:
-                    warnings.log_reply_missing_anchor_date(file_path, micro_id)
+        link_type = data.get('link_type')
+
+        # Texte de recherche construit seulement pour les réponses/accusés de réception sans date
+        if not in_reply_to_date and link_type and (
+                'acknowledges_receipt' in link_type or 'replies_to' in link_type):
+            full_text = f"{data.get('description', '')} {data.get('observations', '')}"
+            in_reply_to_date = self._extract_reply_date(full_text)
+
+            if in_reply_to_date:
+                warnings.log_in_reply_to_date_extracted(file_path, micro_id, in_reply_to_date)
+            else:
+                warnings.log_reply_missing_anchor_date(file_path, micro_id)
 
         # Normalisation confidence
         confidence_raw = data.get('confidence', '').strip().lower()
@@ -158,7 +181,7 @@ class MicroActionParser:
             'micro_id': micro_id,
             'action_type': data.get('action_type'),
             'tags': data.get('tags', ''),
-            'link_type': data.get('link_type'),
+            'link_type': link_type,
             'delivery_channel': data.get('delivery_channel'),
             'date_edtf': date_edtf,
             'date_start': date_start,
@@ -199,21 +222,31 @@ class MicroActionParser:
 
     def _extract_reply_date(self, text: str) -> Optional[str]:
         """Extrait date de référence depuis texte"""
-        for pattern, date_type in self.REPLY_DATE_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if date_type == 'iso':
-                    return match.group(1)
-                elif date_type in ['de_long', 'fr_long']:
-                    day, month_str, year = match.groups()
-                    month = self.MONTH_NAMES.get(month_str.lower(), 0)
-                    if month:
-                        return f"{year}-{month:02d}-{int(day):02d}"
-                elif date_type in ['de_dot', 'fr_dot']:
-                    date_str = match.group(1)
-                    parts = date_str.split('.')
-                    if len(parts) == 3:
-                        return f"{parts[2]}-{parts[1]}-{parts[0]}"
+        # Premier match de chaque motif, en un seul parcours du texte
+        first_matches = {}
+        for match in self.REPLY_DATE_RE.finditer(text):
+            first_matches.setdefault(match.lastgroup, match)
+
+        # Motifs essayés dans l'ordre de priorité déclaré
+        for _, date_type in self.REPLY_DATE_PATTERNS:
+            match = first_matches.get(date_type)
+            if not match:
+                continue
+
+            # Groupes internes du motif : ceux qui suivent son groupe nommé
+            values = match.groups()[self.REPLY_DATE_RE.groupindex[date_type]:]
+            if date_type == 'iso':
+                return values[0]
+            elif date_type in ['de_long', 'fr_long']:
+                day, month_str, year = values[:3]
+                month = self.MONTH_NAMES.get(month_str.lower(), 0)
+                if month:
+                    return f"{year}-{month:02d}-{int(day):02d}"
+            elif date_type in ['de_dot', 'fr_dot']:
+                date_str = values[0]
+                parts = date_str.split('.')
+                if len(parts) == 3:
+                    return f"{parts[2]}-{parts[1]}-{parts[0]}"
         return None
 
     def _extract_entity_id(self, wikilink: str, warnings: WikilinkWarnings,
@@ -232,10 +265,22 @@ class MicroActionParser:
         """Canonicalise micro_id"""
         if raw_id.startswith('/id/microaction/'):
             return raw_id
-        return f"/id/microaction/{hashlib.sha1(raw_id.encode('utf-8')).hexdigest()}"
+        return f"/id/microaction/{_id_digest(raw_id)}"
 
     def _build_document_id_from_path(self, file_path: Path) -> str:
         """Génère doc_id depuis nom fichier (cohérent avec document_parser)"""
-        file_name = file_path.name
-        h = hashlib.sha1(file_name.encode('utf-8')).hexdigest()
-        return f"/id/document/{h}"
\ No newline at end of file
+        return document_base_id(file_path)
+
+
+def _parse_microactions_worker(vault_path: Path, file_path: Path):
+    """
+    Parsing des micro-actions d'un fichier, exécutable dans un process worker.
+    Retourne (micro-actions, warnings du fichier, erreur).
+    """
+    parser = MicroActionParser(vault_path, {})
+    warnings = WikilinkWarnings()
+
+    try:
+        return parser._parse_microactions_from_file(file_path, warnings), warnings, None
+    except Exception as e:
+        return [], warnings, f"{type(e).__name__}: {str(e)}"
@@ -0,0 +1,35 @@
+# utils/parallel.py
+"""
+Exécution parallèle (process pool) du parsing fichier par fichier
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+# En dessous, le démarrage des workers coûte plus que le parsing lui-même
+PARALLEL_MIN_JOBS = 64
+
+# Pas de fork : les parsers lancent leurs pools depuis des threads (master_import),
+# et un fork pendant qu'un autre thread tient un verrou (stdout, lru_cache, imports) peut bloquer l'enfant
+_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def map_jobs(func: Callable[..., Any], jobs: Sequence[tuple], workers: Optional[int] = None) -> List[Any]:
+    """
+    Applique func(*job) à chaque job et retourne les résultats dans l'ordre des jobs.
+
+    Process pool si workers != 1 et assez de jobs, sinon exécution séquentielle.
+    func doit être une fonction de niveau module (picklable).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(jobs) < PARALLEL_MIN_JOBS:
+        return [func(*job) for job in jobs]
+
+    chunksize = max(1, min(32, len(jobs) // (workers * 4)))
+    context = multiprocessing.get_context(_START_METHOD)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return list(executor.map(func, *zip(*jobs), chunksize=chunksize))
@@ -0,0 +1,83 @@
+# utils/parse_cache.py
+"""
+Cache disque des résultats de parsing, indexé par (chemin relatif, mtime, taille)
+
+Un fichier dont le stat() n'a pas changé depuis le run précédent
+réutilise son payload sans relecture ni parsing YAML.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ParseCache:
+    """
+    Cache JSON {"version": version, "entries": {relpath: [st_mtime_ns, st_size, payload]}}
+
+    version identifie la logique qui produit les payloads (à incrémenter par le parser
+    quand elle change) : un cache d'une autre version, ou sans version, est ignoré en entier.
+    """
+
+    def __init__(self, cache_path: Optional[Path], root: Path, version: int):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.root = root
+        self.version = version
+        self._entries: Dict[str, list] = {}
+        self._dirty = False
+
+        if self.cache_path and self.cache_path.exists():
+            try:
+                data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+                if isinstance(data, dict) and data.get('version') == version:
+                    entries = data.get('entries')
+                    if isinstance(entries, dict):
+                        self._entries = entries
+            except (OSError, ValueError):
+                self._entries = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_path is not None
+
+    def _key(self, file_path: Path) -> str:
+        try:
+            return str(file_path.relative_to(self.root))
+        except ValueError:
+            return str(file_path)
+
+    def get(self, file_path: Path, stat: os.stat_result) -> Optional[Any]:
+        """Retourne le payload si le fichier n'a pas changé, sinon None"""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(self._key(file_path))
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        return None
+
+    def put(self, file_path: Path, stat: os.stat_result, payload: Any):
+        """Enregistre un payload (ignoré s'il n'est pas sérialisable en JSON)"""
+        if not self.enabled:
+            return
+
+        try:
+            json.dumps(payload)
+        except (TypeError, ValueError):
+            return  # ex: dates YAML (datetime.date) → pas de cache pour ce fichier
+
+        self._entries[self._key(file_path)] = [stat.st_mtime_ns, stat.st_size, payload]
+        self._dirty = True
+
+    def save(self):
+        """Écriture atomique du cache (fichier temporaire + rename)"""
+        if not self.enabled or not self._dirty:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + '.tmp')
+        data = {'version': self.version, 'entries': self._entries}
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
@@ -0,0 +1,66 @@
+# utils/records.py
+"""
+Enregistrements légers (dataclasses à __slots__) produits par les parsers
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+
+
+class _DictAccess:
+    """
+    Lecture compatible dict (rec.get('x'), rec['x']) limitée aux champs déclarés,
+    pour les consommateurs existants écrits contre des dicts
+    """
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+@dataclass(slots=True)
+class StructureItem(_DictAccess):
+    """
+    Structure réifiée d'une entité (occupation, nom, origine, relation...)
+
+    'properties' reste un dict, passé tel quel à Neo4j.
+    """
+    rid: Optional[str]
+    properties: Dict[str, Any] = field(default_factory=dict)
+    target_id: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'rid': self.rid, 'target_id': self.target_id, 'properties': self.properties}
+
+
+@dataclass(slots=True)
+class EventAssertion(_DictAccess):
+    """Assertion (document → événement) ; 'properties' passé tel quel à Neo4j"""
+    assertion_id: str
+    doc_id: str
+    properties: Dict[str, Any]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'assertion_id': self.assertion_id, 'doc_id': self.doc_id, 'properties': self.properties}
+
+
+@dataclass(slots=True)
+class ParsedEvent(_DictAccess):
+    """Événement parsé ; 'properties' reste un dict (complété par validator, puis envoyé à Neo4j)"""
+    event_id: str
+    properties: Dict[str, Any]
+    assertion: EventAssertion
+    references: Set[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'event_id': self.event_id,
+            'properties': self.properties,
+            'assertion': self.assertion.as_dict(),
+            'references': self.references
+        }
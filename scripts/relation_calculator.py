@@ -33,7 +33,7 @@ class RelationCalculator:
           AND reply.date_start IS NOT NULL
           AND NOT (reply)-[:REPLIES_TO]->()
 
-        CALL (reply) {
+        CALL {
           WITH reply
           MATCH (original:MicroAction)
           WHERE original.actor_id = reply.recipient_id
@@ -153,7 +153,7 @@ class RelationCalculator:
         Crée FOLLOWS_IN_CASE selon doc v1.4.1 Section 6.2
 
         Timeline chronologique des événements par victime.
-        Utilise fallback manuel (APOC non disponible sur Aura).
+        Utilise fallback manuel en Cypher pur (sans dépendance au plugin APOC).
         """
         query = """
         MATCH (e1:Event), (e2:Event)
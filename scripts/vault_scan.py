@@ -0,0 +1,86 @@
+# utils/vault_scan.py
+"""
+Parcours rapide du vault Obsidian (os.scandir au lieu de Path.rglob)
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+
+def iter_markdown_files(root: Union[str, Path]) -> Iterator[Path]:
+    """
+    Équivalent de Path(root).rglob("*.md"), même ordre de parcours
+    (fichiers d'un dossier, puis ses sous-dossiers en profondeur).
+    Les liens symboliques vers des dossiers ne sont pas suivis.
+    """
+    stack = [os.fspath(root)]
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if is_dir:
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.md'):
+                yield Path(entry.path)
+
+        stack.extend(reversed(subdirs))
+
+
+def folder_prefixes(folders: Optional[Iterable[Union[str, Path]]]) -> Optional[Tuple[str, ...]]:
+    """
+    Préfixes 'dossier/' pour filtrer avec str(path).startswith(prefixes) :
+    même test lexical que path.is_relative_to(folder), en un seul appel C.
+    None si aucun dossier (pas de filtrage).
+    """
+    if not folders:
+        return None
+
+    prefixes = []
+    for folder in folders:
+        prefix = str(Path(folder))
+        prefixes.append(prefix if prefix.endswith(os.sep) else prefix + os.sep)
+    return tuple(prefixes)
+
+
+class VaultIndex:
+    """
+    Liste des fichiers .md du vault, parcourue une seule fois et partagée
+    entre les parsers (au lieu d'un parcours complet par parser).
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = os.fspath(root)
+        self.files: List[Path] = list(iter_markdown_files(self.root))
+
+    def markdown_files(self, folder: Union[str, Path]) -> List[Path]:
+        """Fichiers sous folder, dans l'ordre de iter_markdown_files(folder)"""
+        folder = os.fspath(folder)
+        if folder == self.root:
+            return self.files
+        if os.path.islink(folder):
+            # Dossier lien symbolique : non suivi par le parcours du vault
+            return list(iter_markdown_files(folder))
+
+        # Parcours en profondeur : le sous-arbre est un segment contigu de la liste
+        prefix = folder if folder.endswith(os.sep) else folder + os.sep
+        return [path for path in self.files if str(path).startswith(prefix)]
+
+
+def markdown_files(root: Union[str, Path], index: Optional[VaultIndex] = None) -> Iterable[Path]:
+    """Fichiers .md sous root : depuis l'index partagé s'il est fourni, sinon parcours direct"""
+    if index is None:
+        return iter_markdown_files(root)
+    return index.markdown_files(root)
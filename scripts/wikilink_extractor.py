@@ -4,6 +4,7 @@ Extraction et nettoyage des wikilinks Obsidian
 """
 
 import re
+from functools import lru_cache
 from typing import Set, Tuple, Optional
 
 
@@ -50,6 +51,11 @@ class WikilinkWarnings:
     def log_is_part_of_in_body(self, file, entity_id):
         self.is_part_of_in_body_list.append((file, entity_id))
 
+    def merge(self, other: 'WikilinkWarnings'):
+        """Agrège les warnings d'un autre collecteur (ex: process worker)"""
+        for name, values in vars(other).items():
+            getattr(self, name).extend(values)
+
     def get_counts(self):
         return {
             'invalid_wikilinks_ignored': len(self.invalid_wikilinks),
@@ -76,22 +82,36 @@ class WikilinkExtractor:
     }
 
     @staticmethod
-    def clean_id(raw_link: str, warnings: Optional[WikilinkWarnings] = None,
-                 file_path: Optional[str] = None, line_num: Optional[int] = None) -> str:
-        """Nettoie et normalise un ID d'entité"""
+    @lru_cache(maxsize=8192)
+    def _resolve_link(raw_link: str) -> Tuple[str, bool, bool]:
+        """
+        Partie pure de clean_id, mémoïsée par texte de lien
+        (un même agent/lieu revient dans la plupart des blocs) :
+        (ID nettoyé, slash ajouté ?, format valide ?)
+        """
         cleaned = raw_link.strip('[]')
 
         if '|' in cleaned:
             cleaned = cleaned.split('|')[0]
 
-        # Correction slash
-        if not cleaned.startswith('/'):
-            if warnings and file_path:
-                warnings.log_slash_correction(file_path, line_num or 0, raw_link)
+        slash_added = not cleaned.startswith('/')
+        if slash_added:
             cleaned = '/' + cleaned
 
+        return cleaned, slash_added, WikilinkExtractor.ID_PATTERN.match(cleaned) is not None
+
+    @staticmethod
+    def clean_id(raw_link: str, warnings: Optional[WikilinkWarnings] = None,
+                 file_path: Optional[str] = None, line_num: Optional[int] = None) -> str:
+        """Nettoie et normalise un ID d'entité"""
+        cleaned, slash_added, valid = WikilinkExtractor._resolve_link(raw_link)
+
+        # Correction slash
+        if slash_added and warnings and file_path:
+            warnings.log_slash_correction(file_path, line_num or 0, raw_link)
+
         # Validation
-        if not WikilinkExtractor.ID_PATTERN.match(cleaned):
+        if not valid:
             error = f"Invalid ID format: {cleaned}"
             if warnings and file_path:
                 warnings.log_invalid(file_path, line_num or 0, raw_link, error)
@@ -105,6 +125,10 @@ class WikilinkExtractor:
         """Extrait tous les IDs depuis un texte"""
         ids = set()
 
+        # Pas de '[[' → aucun match possible, inutile de lancer le moteur regex
+        if '[[' not in text:
+            return ids
+
         for match in WikilinkExtractor.WIKILINK_PATTERN.finditer(text):
             raw_id = match.group(1)
             line_num = text[:match.start()].count('\n') + 1 if text else 0